@@ -1,9 +1,29 @@
-from gtts import gTTS
+"""Build the narration (jwst_voice.mp3) from jwst_script.txt
 
-# read the script you just downloaded
-with open("jwst_script.txt", "r", encoding="utf-8") as f:
-    text = f.read()
-   
+    python audio.py                    # gTTS, only new or edited sentences are synthesized
+    python audio.py --backend pyttsx3  # offline system voice
+    python audio.py --backend stub     # silent placeholder timed like speech
 
-tts = gTTS(text, lang="en")   # choose lang e.g. 'en'
-tts.save("jwst_voice.mp3")    # output audio file
+Put "[chapter_name]" on its own line in the script to also get one file per
+chapter (jwst_voice_<chapter_name>.mp3).
+"""
+import argparse
+
+from src.utils.constants import NARRATION
+from src.utils.narration import BACKENDS, build_narration
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the JWST narration from the script")
+    parser.add_argument("--script", default=NARRATION["script"])
+    parser.add_argument("--output", default=NARRATION["output"])
+    parser.add_argument("--backend", choices=BACKENDS, default=NARRATION["backend"])
+    parser.add_argument("--lang", default=NARRATION["lang"])   # choose lang e.g. 'en'
+    parser.add_argument("--voice", default=NARRATION["voice"], help="gTTS accent (tld) or pyttsx3 voice id")
+    parser.add_argument("-j", "--jobs", type=int, help="chunks synthesized at once")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    build_narration(args.script, args.output, args.backend, args.lang, args.voice, max_workers=args.jobs)
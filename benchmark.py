@@ -0,0 +1,190 @@
+"""Benchmark the JWST model builders and chapter renders against a stored baseline
+
+    python benchmark.py                    # run everything, compare with the baseline
+    python benchmark.py --save-baseline    # run everything and store it as the new baseline
+    python benchmark.py --builders-only    # just the geometry builders
+    python benchmark.py --chapters intro outro
+
+Builders are timed in this process (fastest of several repeats, peak traced
+allocation). Each chapter is rendered at low quality, with caching off and a
+fixed seed, in its own process, so its peak RSS is its own. Exits with status
+1 if any result regressed beyond the thresholds in BENCHMARK (constants.py).
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import tempconfig
+
+from main import CHAPTERS, MasterScene
+from src.utils.constants import BENCHMARK, RANDOM_SEED
+from src.utils.rng import set_seed
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# MasterScene methods timed in isolation
+BUILDERS = [
+    "create_space_background",
+    "create_starfield_parallax",
+    "create_jwst_model_silhouette",
+    "create_jwst_model",
+    "create_primary_mirror",
+]
+
+# For each metric: True if bigger is better
+METRICS = {
+    "seconds": False,
+    "fps": True,
+    "peak_memory_mb": False,
+    "mobjects": False,
+}
+
+
+def benchmark_config(media_dir, **extra):
+    return {
+        "quality": BENCHMARK["quality"],
+        "disable_caching": True,
+        "input_file": str(PROJECT_ROOT / "main.py"),
+        "media_dir": str(media_dir),
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        **extra,
+    }
+
+
+def count_mobjects(result):
+    mobjects = result if isinstance(result, tuple) else (result,)
+    return sum(len(mobject.get_family()) for mobject in mobjects)
+
+
+def benchmark_builders(media_dir, repeats):
+    """Time each builder, keeping the fastest run, with its peak allocation and mobject count"""
+    results = {}
+    with tempconfig(benchmark_config(media_dir)):
+        scene = MasterScene()
+        for name in BUILDERS:
+            builder = getattr(scene, name)
+            times = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                result = builder()
+                times.append(time.perf_counter() - start)
+
+            tracemalloc.start()
+            builder()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[name] = {
+                "seconds": round(min(times), 5),
+                "peak_memory_mb": round(peak / 2**20, 2),
+                "mobjects": count_mobjects(result),
+            }
+    return results
+
+
+def benchmark_chapter(name, media_dir, seed):
+    """Worker: render one chapter and summarize its profiled plays"""
+    set_seed(seed)
+    with tempconfig(benchmark_config(media_dir, output_file=f"MasterScene_{name}")):
+        scene = MasterScene(render_chapters=[name], profile=True, prewarm=False)
+        scene.render()
+
+    plays = [r for r in scene.profiler.records if r["chapter"] == name and not r["skipped"]]
+    seconds = sum(r["wall_s"] for r in plays)
+    frames = sum(r["frames"] for r in plays)
+    return {
+        "seconds": round(seconds, 3),
+        "frames": frames,
+        "fps": round(frames / seconds, 2) if seconds else 0.0,
+        "peak_memory_mb": max((r["peak_rss_mb"] or 0 for r in plays), default=0),
+        "mobjects": max((r["family_mobjects"] for r in plays), default=0),
+    }
+
+
+def benchmark_chapters(names, media_dir, seed):
+    # One fresh process per chapter: peak RSS is a per-process high-water mark
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[name] = executor.submit(benchmark_chapter, name, media_dir, seed).result()
+        print(f"  {name}: {results[name]['fps']} fps, {results[name]['seconds']} s")
+    return results
+
+
+def compare(results, baseline, thresholds):
+    """Lines describing every result, and the list of regressions"""
+    lines, regressions = [], []
+    for group, entries in results.items():
+        for name, values in entries.items():
+            base = baseline.get(group, {}).get(name, {})
+            for metric, higher_is_better in METRICS.items():
+                if metric not in values:
+                    continue
+                value, before = values[metric], base.get(metric)
+                line = f"{group:<9} {name:<32} {metric:<15} {value:>10}"
+                if before:
+                    change = (value - before) / before
+                    line += f"  baseline {before:>10}  {change:+7.1%}"
+                    worse = -change if higher_is_better else change
+                    if worse > thresholds[metric]:
+                        line += "  REGRESSION"
+                        regressions.append(f"{group}/{name} {metric}")
+                lines.append(line)
+    return lines, regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark JWST builders and chapter renders")
+    parser.add_argument("--chapters", nargs="+", choices=[name for name, _ in CHAPTERS],
+                        help="chapters to render (default: all)")
+    parser.add_argument("--builders-only", action="store_true", help="skip the chapter renders")
+    parser.add_argument("--repeats", type=int, default=BENCHMARK["repeats"])
+    parser.add_argument("--seed", type=int, default=RANDOM_SEED)
+    parser.add_argument("--threshold", type=float,
+                        help="override every regression threshold (e.g. 0.1 for 10%%)")
+    parser.add_argument("--baseline", type=Path, default=PROJECT_ROOT / BENCHMARK["baseline"])
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    set_seed(args.seed)
+    media_dir = PROJECT_ROOT / "media" / "benchmark"
+
+    print("Builders")
+    results = {"builders": benchmark_builders(media_dir, args.repeats)}
+    if not args.builders_only:
+        print("Chapters")
+        names = args.chapters or [name for name, _ in CHAPTERS]
+        results["chapters"] = benchmark_chapters(names, media_dir, args.seed)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    thresholds = dict(BENCHMARK["thresholds"])
+    if args.threshold is not None:
+        thresholds = {metric: args.threshold for metric in thresholds}
+    lines, regressions = compare(results, baseline, thresholds)
+    print("\n".join(lines))
+
+    if args.save_baseline:
+        for group, entries in results.items():
+            baseline.setdefault(group, {}).update(entries)
+        baseline["seed"] = args.seed
+        args.baseline.write_text(json.dumps(baseline, indent=1))
+        print(f"Baseline saved to {args.baseline}")
+    elif not baseline:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+
+    if regressions:
+        print(f"{len(regressions)} regressions: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
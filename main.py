@@ -1,5 +1,9 @@
 """JWST Deployment Animation V2 - Cinematic Master Scene"""
+from functools import partial
+
 from manim import *
+from manim.utils.exceptions import EndSceneEarlyException
+from manim.utils.file_ops import write_to_movie
 import numpy as np
 from src.scenes.outro import outro_scene
 from src.scenes.intro import intro_scene
@@ -7,6 +11,25 @@ from src.scenes.sunshield import sunshield_deployment
 from src.scenes.secondary_mirror import secondary_mirror_deployment
 from src.scenes.primary_mirror import primary_mirror_deployment
 from src.scenes.l2_explainer import l2_explainer
+from src.utils.camera import DeploymentCamera
+from src.utils.complexity import ComplexityAnalyzer
+from src.utils.constants import CHAPTER_CACHE, COMPLEXITY, HOLDS, PLAY_SPLIT, PROFILER, SNAPSHOTS, STATIC_LAYER
+from src.utils.glow import glows_following
+from src.utils.hex_mirror import HexMirror
+from src.utils.layers import LayerRecorder, set_layer
+from src.utils.play_split import STEP, FrameRangeRenderer, joined_play, play_range_path
+from src.utils.frame_pipeline import file_writer_class
+from src.utils.holds import frozen_background, only_background_moves
+from src.utils.profiler import PlayProfiler
+from src.utils.rate_functions import rate_function
+from src.utils.render_cache import chapter_cache_key, chapter_segment_path
+from src.utils.rng import get_seed, random_stream
+from src.utils.scrub import FrameScrubber
+from src.utils.snapshots import load_snapshot, save_snapshot, snapshot_key, snapshot_path
+from src.utils.starfield import StarField
+from src.utils.static_layer import StaticLayer
+from src.utils.text_cache import cached_text, prewarm_texts, save_text_manifest
+from src.utils.timeline import write_timeline
 
 # Constants
 GOLD = "#D4AF37"
@@ -20,59 +43,271 @@ NEBULA_PURPLE = "#4B0082"
 ACCENT_BLUE = "#1E90FF"
 
 class MasterScene(MovingCameraScene):
+    def __init__(self, render_chapters=None, profile=None, dry_run=False, scrub_at=None, scrub_window=0.0,
+                 render_layer=None, layer_pass=False, complexity=None, play_range=None, prewarm=True, **kwargs):
+        # Names of the chapters to render; None renders the whole film
+        self.render_chapters = render_chapters
+        # Record per-play timings (see src/utils/profiler.py)
+        self.profile = PROFILER["enabled"] if profile is None else profile
+        # Check the scene graph of every play against the COMPLEXITY budgets
+        self.analyze_complexity = COMPLEXITY["enabled"] if complexity is None else complexity
+        # Only time the chapters: every play is skipped, nothing is drawn or encoded
+        self.dry_run = dry_run
+        # Film times ("95.2" or "chapter+offset") to save single frames of, skipping the rest
+        self.scrub_at = scrub_at
+        self.scrub_window = scrub_window
+        # Draw only this layer, over transparent black (see src/utils/layers.py)
+        self.render_layer = render_layer
+        # Only fingerprint the layers of every chapter, skipping every play
+        self.layer_pass = layer_pass
+        # Only draw frames first to last of one play: (chapter, play number, first, last, frames)
+        # (see src/utils/play_split.py)
+        self.play_range = play_range
+        # Lay out the texts of earlier runs in a process pool first; render
+        # workers pass False (the process that launched them prewarmed)
+        self.prewarm = prewarm
+        # Chapter being played; names the random streams chapters draw from
+        self.chapter_name = None
+        # Plays so far in that chapter, and its cache key if it is being rendered
+        self.chapter_plays = 0
+        self.chapter_key = None
+        # Cache keys of every chapter, kept by dry runs to plan split plays
+        self.chapter_keys = {}
+        # Seeded so anything still using the global random state is stable too
+        kwargs.setdefault("random_seed", get_seed())
+        kwargs.setdefault("camera_class", DeploymentCamera)
+        # Encodes in step with rasterizing and writes runs of unchanged frames
+        # as held frames on Manim 0.19 (see src/utils/frame_pipeline.py and
+        # holds.py); can step through frames without drawing them (play_split.py)
+        kwargs.setdefault("renderer", FrameRangeRenderer(
+            file_writer_class=file_writer_class(),
+            camera_class=kwargs["camera_class"],
+            skip_animations=kwargs.get("skip_animations", False),
+        ))
+        super().__init__(**kwargs)
+
     def construct(self):
         # self.add_sound("jwst_voice.mp3", time_offset=0.0, gain=None)
         self.camera.background_color = DEEP_BLUE
+        if self.render_layer is not None:
+            # DEEP_BLUE goes under the layers when they are composited
+            self.camera.background_color = BLACK
+            self.camera.render_layer = self.render_layer
+        self.profiler = PlayProfiler(self) if self.profile or self.dry_run else None
+        self.scrubber = FrameScrubber(self, self.scrub_at, self.scrub_window) if self.scrub_at else None
+        self.layer_recorder = LayerRecorder(self) if self.layer_pass else None
+        self.complexity = ComplexityAnalyzer(self) if self.analyze_complexity else None
+        # Lay out the titles and labels of earlier runs in parallel up front,
+        # unless nothing (or only a skipped pass) is going to be drawn
+        if self.prewarm and not (self.dry_run or self.scrub_at or self.layer_pass):
+            prewarm_texts()
         
         stars, nebula = self.create_space_background()
-        self.add(stars, nebula)
-        
-        self.play(FadeIn(stars, nebula, run_time=3))
-        intro_scene(self)   #done 
+        if STATIC_LAYER["enabled"]:
+            # Never changes: drawn from one cached image (see src/utils/static_layer.py)
+            self.background = StaticLayer(stars, nebula)
+        else:
+            self.background = Group(stars, nebula)
+        self.add(self.background)
+
+        # Intro, deployment sequences with transitions, L2 and outro (see CHAPTERS)
+        chapters = self.get_chapters()
+        first = self.restore_snapshot(chapters)
+        for index, (name, chapter) in enumerate(chapters[first:], start=first):
+            self.chapter_name = name
+            self.chapter_plays = 0
+            self.chapter_key = None
+            if self.dry_run and PLAY_SPLIT["enabled"]:
+                self.chapter_keys[name] = chapter_cache_key(chapter, self)
+            if index > 0 and self.snapshots_enabled():
+                path = snapshot_path(name, snapshot_key(self, [c for _, c in chapters[:index]]))
+                if not path.exists():
+                    save_snapshot(self, path)
+            if self.layer_recorder is not None:
+                self.layer_recorder.begin_chapter(name, chapter)
+            if self.complexity is not None:
+                self.complexity.begin_chapter(name)
+            if not (self.dry_run or self.scrub_at or self.layer_pass) and (self.render_chapters is None or name in self.render_chapters):
+                self.play_chapter(name, chapter)
+            else:
+                # Only played to time, scrub or fingerprint it, or to hand its
+                # camera and mobjects on to the next chapter
+                self.next_section(name, skip_animations=True)
+                chapter(self)
+            if self.complexity is not None:
+                self.complexity.end_chapter(name)
+
+        save_text_manifest()
+        if self.complexity is not None:
+            self.complexity.write_report()
+        if self.dry_run:
+            write_timeline(self.profiler.records)
+        elif self.profiler is not None:
+            self.profiler.write_report(PROFILER["directory"], PROFILER["top"])
+
+    def get_chapters(self):
+        """CHAPTERS up to and including the last one this render is asked for"""
+        if self.render_chapters is None:
+            return CHAPTERS
+        names = [name for name, _ in CHAPTERS]
+        unknown = set(self.render_chapters) - set(names)
+        if unknown:
+            raise ValueError(f"Unknown chapters: {', '.join(sorted(unknown))}")
+        last = max(names.index(name) for name in self.render_chapters)
+        return CHAPTERS[:last + 1]
+
+    def snapshots_enabled(self):
+        """Snapshots are taken and restored by renders that play the film in real time"""
+        return SNAPSHOTS["enabled"] and not (self.dry_run or self.scrub_at or self.layer_pass)
+
+    def restore_snapshot(self, chapters):
+        """Restore the state the first requested chapter starts from, return that chapter's index.
+
+        Returns 0 (replay from the start, skipping the chapters before the
+        requested ones) when the whole film is rendered or no snapshot of
+        the current code exists.
+        """
+        if self.render_chapters is None or not self.snapshots_enabled():
+            return 0
+        first = min(index for index, (name, _) in enumerate(chapters) if name in self.render_chapters)
+        if first == 0:
+            return 0
+        name = chapters[first][0]
+        path = snapshot_path(name, snapshot_key(self, [c for _, c in chapters[:first]]))
+        if not path.exists():
+            logger.info("No snapshot for chapter %s, replaying the chapters before it", name)
+            return 0
+        load_snapshot(self, path)
+        logger.info("Chapter %s: starting from snapshot %s", name, path)
+        return first
+
+    def get_moving_mobjects(self, *animations):
+        # A Glow below its moving source must be redrawn with it
+        moving = super().get_moving_mobjects(*animations)
+        return glows_following(self.get_mobject_family_members(), moving)
+
+    def play(self, *args, **kwargs):
+        number = self.chapter_plays
+        self.chapter_plays += 1
+        window, joined = None, None
+        if self.play_range is not None and self.chapter_name == self.play_range[0]:
+            # Range worker: step up to the window, end the render after it
+            chapter, play, first, last, frames = self.play_range
+            if number == play and play_range_path(chapter, self.chapter_key, play, (first, last), frames).exists():
+                raise EndSceneEarlyException()
+            window = STEP if number < play else (first, last)
+        elif self.chapter_key is not None and PLAY_SPLIT["enabled"]:
+            joined = joined_play(self.renderer.file_writer, self.chapter_name, self.chapter_key, number)
+            window = STEP if joined is not None else None
+
+        self.renderer.frame_window = window
+        try:
+            super().play(*args, **kwargs)
+        finally:
+            self.renderer.frame_window = None
+
+        if joined is not None:
+            # Stand the stitched ranges in for the stepped play
+            self.renderer.file_writer.partial_movie_files[-1] = str(joined)
+            logger.info("Chapter %s: play %d from rendered ranges %s", self.chapter_name, number, joined)
+        if window is not None and window != STEP:
+            raise EndSceneEarlyException()
+
+    def get_time_progression(self, run_time, description, n_iterations=None, override_skip_animations=False):
+        # A stepped play is skipped, but still goes through every frame time
+        stepped = override_skip_animations or self.renderer.frame_window == STEP
+        return super().get_time_progression(run_time, description, n_iterations, stepped)
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None, frozen_frame=None):
+        # Optionally twinkles and pulses pause, so a wait where nothing else
+        # moves is one held frame; any other motion keeps them running
+        if (
+            not HOLDS["freeze_background"] or stop_condition is not None or frozen_frame is not None
+            or not only_background_moves(self)
+        ):
+            return super().wait(duration, stop_condition, frozen_frame)
+        with frozen_background(self):
+            return super().wait(duration, stop_condition, frozen_frame)
+
+    def reveal_background(self):
+        """Fade in the starfield and nebula at the start of the film"""
+        self.play(FadeIn(self.background, run_time=3))
 
-        # Main deployment sequences with smooth transitions
-        sunshield_deployment(self)   #done
-        self.transition_effect("Secondary Mirror Deployment")
-        secondary_mirror_deployment(self) 
-        self.transition_effect("Primary Mirror Deployment")
-        primary_mirror_deployment(self)
-        self.transition_effect("Journey to L2")
-        l2_explainer(self)
+    def chapter_cache_enabled(self):
+        """Chapter segments are only cached for full movie renders"""
+        return (
+            CHAPTER_CACHE["enabled"]
+            and self.render_layer is None
+            and self.play_range is None
+            and write_to_movie()
+            and not config.disable_caching
+            and not config.save_last_frame
+            and config.from_animation_number == 0
+            and config.upto_animation_number < 0
+        )
+
+    def play_chapter(self, name, chapter):
+        """Play one chapter, reusing its cached segment if nothing it depends on changed"""
+        # Long plays rendered in frame ranges are filed under the chapter's key too
+        key = chapter_cache_key(chapter, self)
+        if not self.chapter_cache_enabled():
+            # (a layer render must not stitch in full frames)
+            self.chapter_key = key if self.render_layer is None else None
+            self.next_section(name)
+            chapter(self)
+            return
+
+        file_writer = self.renderer.file_writer
+        segment = chapter_segment_path(CHAPTER_CACHE["directory"], name, key)
+        first_play = len(file_writer.partial_movie_files)
+        cached = segment.exists()
+        self.chapter_key = None if cached else key
+
+        # A cached chapter still runs (skipped) so the camera and mobjects it
+        # leaves behind are there for the next chapter
+        self.next_section(name, skip_animations=cached)
+        chapter(self)
+
+        if cached:
+            # Stand the segment in for the chapter's first skipped play, so the
+            # final film is stitched from it without re-encoding
+            file_writer.partial_movie_files[first_play] = str(segment)
+            logger.info("Chapter %s: using cached segment %s", name, segment)
+            return
 
-        outro_scene(self)      #done
+        rendered = [path for path in file_writer.partial_movie_files[first_play:] if path is not None]
+        if rendered:
+            temp_segment = segment.with_name(f"{segment.stem}_temp{segment.suffix}")
+            file_writer.combine_files(rendered, temp_segment)
+            temp_segment.replace(segment)
 
-    def create_space_background(self):
+    def create_space_background(self, star_count=400):
         """Create a rich space background with stars and nebula"""
-        stars = VGroup()
-        for i in range(400): 
-            brightness = np.random.uniform(0.3, 0.8)
-            size = np.random.uniform(0.001, 0.01)  # Slightly larger stars
-            star = Dot(
-                radius=size,
-                color=WHITE
-            ).set_opacity(brightness)
-            
-            star.move_to([
-                np.random.uniform(-8, 8),
-                np.random.uniform(-5, 5),
-                0
-            ])
-            stars.add(star)
+        rng = random_stream("background")
+        stars = StarField(
+            positions=np.column_stack([
+                rng.uniform(-8, 8, star_count),
+                rng.uniform(-5, 5, star_count),
+                np.zeros(star_count)
+            ]),
+            radii=rng.uniform(0.001, 0.01, star_count),  # Slightly larger stars
+            brightness=rng.uniform(0.3, 0.8, star_count)
+        )
         
         # Nebula cloud - more detailed
         nebula = VGroup()
         colors = [NEBULA_BLUE, NEBULA_PURPLE, "#3E309B", "#0F1955"]
         for i in range(8):
             cloud = Ellipse(
-                width=np.random.uniform(4, 8),
-                height=np.random.uniform(2, 4),
+                width=rng.uniform(4, 8),
+                height=rng.uniform(2, 4),
                 color=colors[i % len(colors)],
-                fill_opacity=np.random.uniform(0.05, 0.2),
+                fill_opacity=rng.uniform(0.05, 0.2),
                 stroke_width=0
             )
             cloud.move_to([
-                np.random.uniform(-6, 6),
-                np.random.uniform(-3, 3),
+                rng.uniform(-6, 6),
+                rng.uniform(-3, 3),
                 0
             ])
             nebula.add(cloud)
@@ -101,23 +336,20 @@ class MasterScene(MovingCameraScene):
         
         return VGroup(sunshield, primary_mirror, secondary_mirror, bus)
 
-    def create_starfield_parallax(self):
+    def create_starfield_parallax(self, star_count=150):
         """Create a starfield with parallax effect"""
-        stars = VGroup()
-        for i in range(150):
-            depth = np.random.uniform(0.5, 2.0)  # Parallax depth factor
-            size = 0.03 / depth
-            brightness = 0.4 / depth
-            
-            star = Dot(radius=size, color=WHITE).set_opacity(brightness)
-            star.move_to([
-                np.random.uniform(-8, 8),
-                np.random.uniform(-5, 5),
-                0
-            ])
-            star.depth = depth
-            stars.add(star)
-        return stars
+        rng = random_stream(self.chapter_name or "background", "parallax")
+        depths = rng.uniform(0.5, 2.0, star_count)  # Parallax depth factor
+        return StarField(
+            positions=np.column_stack([
+                rng.uniform(-8, 8, star_count),
+                rng.uniform(-5, 5, star_count),
+                np.zeros(star_count)
+            ]),
+            radii=0.03 / depths,
+            brightness=0.4 / depths,
+            depths=depths
+        )
 
     def transition_effect(self, next_scene_title):
         """Smooth transition between scenes with title card"""
@@ -127,6 +359,7 @@ class MasterScene(MovingCameraScene):
         
         # Add glow effect
         glow_circle = transition_circle.copy().set_opacity(0.3).scale(1.2)
+        set_layer("effects", glow_circle)
         
         self.play(
             Create(glow_circle),
@@ -138,12 +371,12 @@ class MasterScene(MovingCameraScene):
             transition_circle.animate.scale(25).set_opacity(0),
             glow_circle.animate.scale(30).set_opacity(0),
             run_time=1.5,
-            rate_func=smooth
+            rate_func=rate_function("smooth_deployment")
         )
         
         # Show next scene title with style
-        title = Text(next_scene_title, font_size=42, color=GOLD)
-        subtitle = Text("James Webb Space Telescope", font_size=24, color=SILVER)
+        title = cached_text(next_scene_title, font_size=42, color=GOLD)
+        subtitle = cached_text("James Webb Space Telescope", font_size=24, color=SILVER)
         subtitle.next_to(title, DOWN, buff=0.3)
         
         title_group = VGroup(title, subtitle)
@@ -159,6 +392,7 @@ class MasterScene(MovingCameraScene):
             stroke_width=2
         )
         title_bg.move_to(title_group.get_center())
+        set_layer("hud", title_bg)
         
         self.play(
             FadeIn(title_bg),
@@ -264,62 +498,42 @@ class MasterScene(MovingCameraScene):
         return Group(sunshield_layers, primary_mirror, secondary_system, bus, bus_details, dta_tower, solar_panel, antenna)
 
     def create_primary_mirror(self):
-        """Create the 18-segment primary mirror with larger polygons."""
-
-        def create_hexagon(radius=0.5, color="#FFD700"):
-            hexagon = RegularPolygon(6, radius=radius)
-            hexagon.set_fill(color, opacity=1)
-            hexagon.set_stroke(WHITE, width=1.5)
-            return hexagon
-
-        # Central hexagon
-        center_hex = create_hexagon()
-        all_segments = VGroup(center_hex)
-
-        # First ring (6 hexagons)
-        for i in range(6):
-            angle = i * PI / 3
-            hex_pos = 0.9 * np.array([np.cos(angle), np.sin(angle), 0]) 
-            seg = create_hexagon().move_to(hex_pos)
-            all_segments.add(seg)
-
-        # Second ring (12 hexagons)
-        wing_left = VGroup()
-        wing_right = VGroup()
-        for i in range(6):
-            angle = i * PI / 3
-            hex_pos = 1.75 * np.array([np.cos(angle), np.sin(angle), 0]) 
-            seg = create_hexagon().move_to(hex_pos)
-            if hex_pos[0] < 0:
-                wing_left.add(seg)
-            else:
-                wing_right.add(seg)
-
-        for i in range(6):
-            angle = i * PI / 3 + PI / 6
-            hex_pos = 1.75 * np.array([np.cos(angle), np.sin(angle), 0])
-            seg = create_hexagon().move_to(hex_pos)
-            if hex_pos[0] < 0:
-                wing_left.add(seg)
-            else:
-                wing_right.add(seg)
-
-        # Frame & highlights
-        frame = SurroundingRectangle(all_segments, buff=0.2, color="#FFE65B", stroke_width=2).set_opacity(0.3)
-
-        highlights = VGroup()
-        for hex_seg in all_segments:
-            dot = Dot(point=hex_seg.get_center() + 0.15*UP + 0.1*RIGHT, color=WHITE, radius=0.04)  # slightly larger
-            highlights.add(dot)
-
-        mirror_group = VGroup(all_segments, wing_left, wing_right, frame, highlights)
-
-        return mirror_group
+        """Create the 18-segment primary mirror (with the central segment) as a hex grid."""
+        return HexMirror(rings=2, segment_radius=0.5, gap=0.05, color="#FFD700")
 
 
+# Chapters of the film in playing order, each called with the MasterScene
+CHAPTERS = [
+    ("opening", MasterScene.reveal_background),
+    ("intro", intro_scene),
+    ("sunshield_deployment", sunshield_deployment),
+    ("secondary_mirror_transition", partial(MasterScene.transition_effect, next_scene_title="Secondary Mirror Deployment")),
+    ("secondary_mirror", secondary_mirror_deployment),
+    ("primary_mirror_transition", partial(MasterScene.transition_effect, next_scene_title="Primary Mirror Deployment")),
+    ("primary_mirror", primary_mirror_deployment),
+    ("l2_transition", partial(MasterScene.transition_effect, next_scene_title="Journey to L2")),
+    ("l2_explainer", l2_explainer),
+    ("outro", outro_scene),
+]
 
 
-    
+def resolve_chapter(prefix):
+    """Name of the chapter called prefix, or the only one starting with it"""
+    names = [name for name, _ in CHAPTERS]
+    if prefix in names:
+        return prefix
+    matches = [name for name in names if name.startswith(prefix)]
+    if len(matches) != 1:
+        found = f"matches {', '.join(matches)}" if matches else "matches no chapter"
+        raise ValueError(f"Chapter {prefix!r} {found}; chapters are {', '.join(names)}")
+    return matches[0]
 
 
-    
\ No newline at end of file
+def chapter_range(first=None, last=None):
+    """Names of the chapters from first to last (prefixes allowed), both included"""
+    names = [name for name, _ in CHAPTERS]
+    start = names.index(resolve_chapter(first)) if first else 0
+    end = names.index(resolve_chapter(last)) if last else len(names) - 1
+    if start > end:
+        raise ValueError(f"Chapter {names[start]} comes after {names[end]}")
+    return names[start:end + 1]
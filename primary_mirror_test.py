@@ -2,6 +2,8 @@
 from manim import *
 import numpy as np
 from src.scenes.primary_mirror import primary_mirror_deployment
+from src.utils.camera import DeploymentCamera
+from src.utils.hex_mirror import HexMirror
 
 # Constants used below
 GOLD = "#D4AF37"
@@ -10,6 +12,11 @@ DEEP_BLUE = "#0B1426"
 ACCENT_BLUE = "#1E90FF"
 
 class PrimaryMirrorTest(MovingCameraScene):
+    def __init__(self, **kwargs):
+        # Draws the Glows used by primary_mirror_deployment
+        kwargs.setdefault("camera_class", DeploymentCamera)
+        super().__init__(**kwargs)
+
     def construct(self):
         self.camera.background_color = DEEP_BLUE
         self.transition_effect("Primary Mirror Deployment")
@@ -72,49 +79,5 @@ class PrimaryMirrorTest(MovingCameraScene):
 
 
     def create_primary_mirror(self):
-        """Create the 18-segment primary mirror"""
-        def create_hexagon(radius=0.25):
-            return RegularPolygon(6, radius=radius, color=GOLD, 
-                                fill_opacity=0.95, stroke_color=WHITE, stroke_width=1.5)
-        
-        # Central hexagon
-        center_hex = create_hexagon()
-        hexagons = VGroup(center_hex)
-        
-        # First ring (6 hexagons)
-        for i in range(6):
-            angle = i * PI / 3
-            hex_pos = 0.43 * np.array([np.cos(angle), np.sin(angle), 0])
-            hex_seg = create_hexagon().move_to(hex_pos)
-            hexagons.add(hex_seg)
-        
-        # Second ring (12 hexagons) - wings
-        wing_left = VGroup()
-        wing_right = VGroup()
-        
-        for i in range(6):
-            angle = i * PI / 3
-            hex_pos = 0.86 * np.array([np.cos(angle), np.sin(angle), 0])
-            hex_seg = create_hexagon().move_to(hex_pos)
-            if hex_pos[0] < 0:
-                wing_left.add(hex_seg)
-            else:
-                wing_right.add(hex_seg)
-        
-        # Additional outer hexagons
-        for i in range(6):
-            angle = i * PI / 3 + PI/6
-            hex_pos = 0.86 * np.array([np.cos(angle), np.sin(angle), 0])
-            hex_seg = create_hexagon().move_to(hex_pos)
-            if hex_pos[0] < 0:
-                wing_left.add(hex_seg)
-            else:
-                wing_right.add(hex_seg)
-        
-        return Group(hexagons, wing_left, wing_right)
-
-
-    
-
-
-    
\ No newline at end of file
+        """Create the 18-segment primary mirror (same builder as MasterScene, smaller)"""
+        return HexMirror(rings=2, segment_radius=0.25, gap=0.02, color=GOLD, fill_opacity=0.95)
@@ -0,0 +1,122 @@
+"""Render the JWST deployment film from the command line
+
+    python render.py -pqh             # same as: manim -pqh main.py MasterScene
+    python render.py -qh --jobs 10    # render long plays in frame ranges, then the chapters, in 10 processes
+    python render.py -qh --seed 7     # different (but repeatable) stars and nebula
+    python render.py -ql --profile    # per-play timings in media/profiles/
+    python render.py --dry-run        # timeline only, checked against SCENE_DURATIONS
+    python render.py --at primary_mirror+4.5 --window 0.5   # just the frames around that moment
+    python render.py -qh --layers     # re-render only the layers (background, model, ...) that changed
+    python render.py -ql --from sunshield --to primary_mirror   # just those chapters, from a snapshot
+    python render.py --dry-run --complexity   # scene-graph size per chapter, checked against budgets
+"""
+import argparse
+import os
+from pathlib import Path
+
+from manim import tempconfig
+
+from main import CHAPTERS, MasterScene, chapter_range
+from src.utils.constants import CHAPTER_CACHE, PLAY_SPLIT, SCRUB
+from src.utils.layers import render_layered
+from src.utils.parallel_render import render_chapters_parallel
+from src.utils.play_split import render_plays_split
+from src.utils.rng import get_seed, set_seed
+from src.utils.text_cache import prewarm_texts
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Render the JWST deployment film (MasterScene)")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h",
+                        help="l=low, m=medium, h=high, p=production, k=4K")
+    parser.add_argument("-p", "--preview", action="store_true", help="open the film after rendering")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="render long plays and chapters in this many processes (0 = one per CPU core)")
+    parser.add_argument("--seed", type=int, default=get_seed(),
+                        help="seed for all random geometry (default: RANDOM_SEED in constants.py)")
+    parser.add_argument("--profile", action="store_true",
+                        help="record per-play timings to media/profiles/ (JSON, CSV and a top-N summary)")
+    parser.add_argument("--complexity", action="store_true",
+                        help="measure the scene graph of every play and check it against the COMPLEXITY budgets")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="skip drawing and encoding, write the play timeline and check chapter budgets")
+    parser.add_argument("--at", nargs="+", metavar="TIME",
+                        help="only save the frames at these times: seconds into the film or chapter+seconds")
+    parser.add_argument("--window", type=float, default=0.0,
+                        help="with --at, save every frame of this many seconds around each time")
+    parser.add_argument("--layers", action="store_true",
+                        help="render each chapter as separately cached layers and composite them")
+    parser.add_argument("--full-res", action="store_true",
+                        help="with --at, use the -q resolution instead of the low-resolution proxy")
+    parser.add_argument("--from", dest="first", metavar="CHAPTER",
+                        help="first chapter to render (a unique prefix is enough)")
+    parser.add_argument("--to", dest="last", metavar="CHAPTER",
+                        help="last chapter to render (a unique prefix is enough)")
+    args = parser.parse_args()
+    try:
+        args.chapters = chapter_range(args.first, args.last)
+    except ValueError as error:
+        parser.error(str(error))
+    return args
+
+
+def main():
+    args = parse_args()
+    jobs = args.jobs or os.cpu_count()
+    set_seed(args.seed)
+
+    with tempconfig({"quality": QUALITIES[args.quality], "input_file": str(Path(__file__).with_name("main.py"))}):
+        if args.at:
+            scrub_config = {"write_to_movie": False}
+            if not args.full_res:
+                scrub_config["pixel_height"] = SCRUB["proxy_height"]
+                scrub_config["pixel_width"] = SCRUB["proxy_height"] * 16 // 9
+            with tempconfig(scrub_config):
+                scene = MasterScene(scrub_at=args.at, scrub_window=args.window, complexity=args.complexity or None)
+                scene.render()
+            for path in scene.scrubber.report():
+                print(path)
+            return
+        if args.dry_run:
+            with tempconfig({"write_to_movie": False}):
+                MasterScene(dry_run=True, complexity=args.complexity or None).render()
+            return
+        if (args.layers or jobs > 1) and CHAPTER_CACHE["enabled"]:
+            # Once, here: the workers find the laid-out texts on disk
+            prewarm_texts()
+        if args.layers:
+            if CHAPTER_CACHE["enabled"]:
+                render_layered(MasterScene)
+            else:
+                print("Layered rendering needs CHAPTER_CACHE enabled, rendering flat")
+        elif jobs > 1:
+            if CHAPTER_CACHE["enabled"]:
+                # Long plays first: the chapter workers stitch their ranges in
+                if PLAY_SPLIT["enabled"]:
+                    render_plays_split(MasterScene, args.chapters, jobs)
+                render_chapters_parallel(MasterScene, args.chapters, jobs, profile=args.profile)
+            else:
+                print("Parallel rendering needs CHAPTER_CACHE enabled, rendering sequentially")
+
+        # A chapter range starts from the snapshot saved at its first chapter
+        # by an earlier render, and gets a movie file of its own
+        render_chapters, range_config = None, {}
+        if len(args.chapters) < len(CHAPTERS):
+            render_chapters = args.chapters
+            range_config["output_file"] = f"MasterScene_{args.chapters[0]}_to_{args.chapters[-1]}"
+        with tempconfig(range_config):
+            # With every chapter cached this only stitches the segments together
+            scene = MasterScene(render_chapters=render_chapters, profile=args.profile, complexity=args.complexity or None)
+            scene.render(preview=args.preview)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 from manim import *
 import numpy as np
+from src.utils.animations import ParallaxShift
+from src.utils.assets import load_logo_parts
+from src.utils.glow import Glow
+from src.utils.text_cache import cached_text
 
 SILVER = "#C0C0C0"
 ACCENT_BLUE = "#1E90FF"
@@ -9,36 +13,28 @@ def intro_scene(scene):
     stars = scene.create_starfield_parallax()
     scene.add(stars)
     
-    # Line-art logo
-    svg_logo = SVGMobject("assets/logo.svg")
-    svg_logo.set_fill(opacity=0).set_stroke(color=GOLD, width=6)
-    svg_logo.scale(1.2).shift(UP * 0.5)
-
-    # Collect drawable subpaths and sort them
-    parts = [m.copy().set_fill(opacity=0).set_stroke(GOLD, width=6)
-             for m in svg_logo.family_members_with_points()
-             if len(m.get_points()) > 0]
-    parts.sort(key=lambda p: (np.round(p.get_center()[0], 2), np.round(p.get_center()[1], 2)))
-    parts_group = VGroup(*parts)
+    # Line-art logo: drawable subpaths, sorted (cached after the first parse)
+    parts_group = load_logo_parts("assets/logo.svg", color=GOLD, stroke_width=6, scale=1.2, shift=UP * 0.5)
+    parts = list(parts_group)
 
     # Soft glow behind the strokes
-    glow = parts_group.copy().set_stroke(GOLD, width=14, opacity=0.18)
+    glow = Glow(parts_group, color=GOLD, width=14, intensity=0.18)
     scene.add(glow)
 
-    name = Text("ImransLab", font_size=48, color=GOLD)
+    name = cached_text("ImransLab", font_size=48, color=GOLD)
     name.next_to(parts_group, DOWN, buff=0.3)
 
-    tagline = Text("Learn Anything and Everything", font_size=28, color=SILVER)
+    tagline = cached_text("Learn Anything and Everything", font_size=28, color=SILVER)
     tagline.next_to(name, DOWN, buff=0.2)
     
-    # Animate stars moving
-    star_animations = [star.animate.shift(LEFT * star.depth * 0.5) for star in stars]
+    # Animate stars moving (nearer stars move further)
+    star_animation = ParallaxShift(stars, LEFT * 0.5, lag_ratio=0.01)
     
     # Draw each subpath sequentially 
     scene.play(
         AnimationGroup(
             Succession(*[Create(p) for p in parts]),
-            LaggedStart(*star_animations, lag_ratio=0.01),
+            star_animation,
             lag_ratio=0
         ),
         run_time=2.6
@@ -47,11 +43,11 @@ def intro_scene(scene):
     scene.wait(1)
     
     # Title reveal with JWST silhouette
-    title_line1 = Text("JWST: Unfolding in Space", font_size=56, color=GOLD)
-    title_line2 = Text("2D Cinematic Video", font_size=56, color=GOLD)
+    title_line1 = cached_text("JWST: Unfolding in Space", font_size=56, color=GOLD)
+    title_line2 = cached_text("2D Cinematic Video", font_size=56, color=GOLD)
     title = VGroup(title_line1, title_line2).arrange(DOWN, buff=0.2)
     title.move_to(ORIGIN)
-    subtitle = Text("Deployment Sequence", font_size=32, color=WHITE)
+    subtitle = cached_text("Deployment Sequence", font_size=32, color=WHITE)
     subtitle.next_to(title, DOWN, buff=0.4)
     
     # Camera movement for dramatic effect
@@ -1,26 +1,33 @@
 import numpy as np
 from manim import *
+from src.utils.animations import MoveAlongArcLength, add_twinkle
+from src.utils.glow import Glow
+from src.utils.holds import background_updater
+from src.utils.layers import set_layer
+from src.utils.rng import random_stream
+from src.utils.starfield import StarField
+from src.utils.text_cache import cached_text
 
 SILVER = "#C0C0C0"
 DEEP_BLUE = "#0B1426"
 
 def l2_explainer(scene):
     # --- Background stars (twinkling) ---
-    stars = VGroup(*[
-        Dot(
-            point=[np.random.uniform(-7, 7), np.random.uniform(-4, 4), 0],
-            radius=np.random.uniform(0.01, 0.03),
-            color=WHITE
-        )
-        for _ in range(70)
-    ])
+    star_count = 70
+    rng = random_stream("l2_explainer", "stars")
+    stars = StarField(
+        positions=np.column_stack([
+            rng.uniform(-7, 7, star_count),
+            rng.uniform(-4, 4, star_count),
+            np.zeros(star_count)
+        ]),
+        radii=rng.uniform(0.01, 0.03, star_count),
+        brightness=1
+    )
     scene.add(stars)
 
-    # Stars twinkle updater
-    def twinkle(dot, dt):
-        dot.set_opacity(0.3 + 0.7*np.abs(np.sin(scene.time*2*np.pi*np.random.uniform(0.5, 1.5))))
-    for star in stars:
-        star.add_updater(twinkle)
+    # Stars twinkle updater (one for the whole field)
+    add_twinkle(stars, seed=random_stream("l2_explainer", "twinkle"))
 
     # --- Sun ---
     sun = Circle(radius=0.8, color=ORANGE, fill_opacity=1).shift(LEFT * 4)
@@ -29,11 +36,11 @@ def l2_explainer(scene):
     sun_glow = Circle(radius=1.2, color=ORANGE, fill_opacity=0.5)
     sun_glow.move_to(sun.get_center())
     
-    # Glow updater (pulsating)
+    # Glow updater (pulsating); background motion, paused during waits
     def pulse_sun(mob, dt):
         mob.set_opacity(0.4 + 0.3*np.abs(np.sin(scene.time*2*np.pi)))
         mob.scale(1 + 0.01*np.sin(scene.time*2*np.pi))
-    sun_glow.add_updater(pulse_sun)
+    sun_glow.add_updater(background_updater(pulse_sun))
 
     # Sun rays
     rays = VGroup(*[
@@ -41,10 +48,10 @@ def l2_explainer(scene):
         for angle in np.linspace(0, 2*np.pi, 18)
     ])
     rays.move_to(sun.get_center())
-    rays.add_updater(lambda mob, dt: mob.rotate(0.01))
+    rays.add_updater(background_updater(lambda mob, dt: mob.rotate(0.01)))
 
     # Sun label
-    sun_label = Text("Sun", font_size=28, color=ORANGE).next_to(sun, DOWN)
+    sun_label = cached_text("Sun", font_size=28, color=ORANGE).next_to(sun, DOWN)
 
     # Animate Sun
     scene.play(DrawBorderThenFill(sun), Create(sun_glow), Create(rays), Write(sun_label), run_time=2)
@@ -54,7 +61,7 @@ def l2_explainer(scene):
     scene.play(Create(earth_orbit), run_time=2)
 
     earth = Circle(radius=0.3, color=BLUE, fill_opacity=1)
-    earth_label = Text("Earth", font_size=24, color=BLUE).next_to(earth, DOWN)
+    earth_label = cached_text("Earth", font_size=24, color=BLUE).next_to(earth, DOWN)
 
     def orbit_earth(mob, dt):
         mob.rotate_about_origin(dt * 0.2)
@@ -65,31 +72,33 @@ def l2_explainer(scene):
 
     # --- L2 point ---
     l2_point = Dot(radius=0.15, color=RED).shift(RIGHT * 3.5)
-    l2_label = Text("L2 Lagrange Point", font_size=22, color=RED).next_to(l2_point, UP)
+    l2_label = cached_text("L2 Lagrange Point", font_size=22, color=RED).next_to(l2_point, UP)
     scene.play(DrawBorderThenFill(l2_point), Write(l2_label), run_time=2)
 
     # Distance indicator
     distance_line = DashedLine(earth.get_center(), l2_point.get_center(), color=WHITE, stroke_width=2)
-    distance_label = Text("1.5 million km", font_size=20, color=WHITE).next_to(distance_line, UP, buff=0.1)
+    distance_label = cached_text("1.5 million km", font_size=20, color=WHITE).next_to(distance_line, UP, buff=0.1)
     scene.play(Create(distance_line), Write(distance_label), run_time=2)
 
     # --- Halo orbit ---
     halo_orbit = Circle(radius=0.5, color=GREEN, stroke_width=3).move_to(l2_point.get_center())
-    halo_glow = halo_orbit.copy().set_color("#00FF00").set_opacity(0.4).scale(1.1)
-    halo_glow.add_updater(lambda mob, dt: mob.set_opacity(0.3 + 0.3*np.abs(np.sin(scene.time*2*np.pi))))
-    halo_label = Text("Halo Orbit", font_size=20, color=GREEN).next_to(halo_orbit, RIGHT, buff=0.2)
-    scene.play(Create(halo_orbit), Create(halo_glow), Write(halo_label), run_time=2)
+    halo_glow = Glow(halo_orbit, color="#00FF00", intensity=0.4, width=3, spread=1.1)
+    halo_glow.add_updater(background_updater(lambda mob, dt: mob.set_opacity(0.3 + 0.3*np.abs(np.sin(scene.time*2*np.pi)))))
+    halo_label = cached_text("Halo Orbit", font_size=20, color=GREEN).next_to(halo_orbit, RIGHT, buff=0.2)
+    # The glow is drawn along with the orbit as Create builds it
+    scene.add(halo_glow)
+    scene.play(Create(halo_orbit), Write(halo_label), run_time=2)
 
     # --- JWST ---
     jwst_icon = Triangle(color=GOLD, fill_opacity=1).scale(0.1).move_to(halo_orbit.point_from_proportion(0))
     trail = TracedPath(jwst_icon.get_center, stroke_color=GOLD, stroke_width=2)
     scene.add(trail)
     scene.play(DrawBorderThenFill(jwst_icon), run_time=1)
-    scene.play(MoveAlongPath(jwst_icon, halo_orbit), rate_func=linear, run_time=6)
+    scene.play(MoveAlongArcLength(jwst_icon, halo_orbit), rate_func=linear, run_time=6)
     scene.remove(trail)
 
     # --- Thermal explanation ---
-    thermal_text = Text(
+    thermal_text = cached_text(
         "Sunshield protects telescope\nfrom Sun, Earth and Moon heat",
         font_size=24, color=WHITE
     ).to_edge(DOWN, buff=0.5)
@@ -102,6 +111,7 @@ def l2_explainer(scene):
         stroke_color=GOLD,
         stroke_width=2
     ).move_to(thermal_text.get_center())
+    set_layer("hud", text_bg)
 
     scene.play(FadeIn(text_bg), Write(thermal_text), run_time=2)
     scene.wait(3)
@@ -1,5 +1,8 @@
 import numpy as np      
 from manim import *
+from src.utils.glow import Glow
+from src.utils.rate_functions import rate_function
+from src.utils.text_cache import cached_text
 
 SILVER = "#C0C0C0"
 ACCENT_BLUE = "#1E90FF"
@@ -10,11 +13,11 @@ def primary_mirror_deployment(scene):
     # Create primary mirror
     primary_mirror_group = scene.create_primary_mirror()
     
-    # Extract components: assuming the returned group is:
-    # VGroup(all_segments(center + first ring), left_wing, right_wing, frame, highlights)
-    all_segments = primary_mirror_group[0]  # center + first ring
-    left_wing = primary_mirror_group[1]
-    right_wing = primary_mirror_group[2]
+    # Extract components of the HexMirror:
+    # body (fixed segments), left_wing, right_wing, frame, highlights
+    all_segments = primary_mirror_group.body
+    left_wing = primary_mirror_group.wing_left
+    right_wing = primary_mirror_group.wing_right
 
     # Move mirror to correct position
     primary_mirror_group.move_to(UP * 3)
@@ -33,8 +36,8 @@ def primary_mirror_deployment(scene):
     # )
     
     # Add glow effect to wings during deployment
-    left_glow = left_wing.copy().set_color(ACCENT_BLUE).set_opacity(0.3)
-    right_glow = right_wing.copy().set_color(ACCENT_BLUE).set_opacity(0.3)
+    left_glow = Glow(left_wing, color=ACCENT_BLUE, intensity=0.3, fill=True)
+    right_glow = Glow(right_wing, color=ACCENT_BLUE, intensity=0.3, fill=True)
     scene.add(left_glow, right_glow)
     
     # Deploy left wing
@@ -43,9 +46,9 @@ def primary_mirror_deployment(scene):
             left_wing, 
             angle=-PI/3, 
             about_point=all_segments.get_left(),
-            rate_func=smooth
+            rate_func=rate_function("smooth_deployment")
         ),
-        left_glow.animate.rotate(-PI/3, about_point=all_segments.get_left()).set_opacity(0.1),
+        left_glow.animate.set_opacity(0.1),
         run_time=3
     )
     
@@ -55,9 +58,9 @@ def primary_mirror_deployment(scene):
             right_wing, 
             angle=PI/3, 
             about_point=all_segments.get_right(),
-            rate_func=smooth
+            rate_func=rate_function("smooth_deployment")
         ),
-        right_glow.animate.rotate(PI/3, about_point=all_segments.get_right()).set_opacity(0.1),
+        right_glow.animate.set_opacity(0.1),
         run_time=3
     )
     
@@ -70,7 +73,9 @@ def primary_mirror_deployment(scene):
     )
     
     # Highlight individual segments with sequential animation
-    for i, segment in enumerate(all_segments[:4]):
+    for i in range(4):
+        # Recolor an overlay of the segment that stays in the mirror until it fades out
+        segment = primary_mirror_group.add_segment_overlay(i)
         segment_glow = segment.copy().set_color(YELLOW).set_opacity(0.5)
         scene.add(segment_glow)
         
@@ -85,7 +90,7 @@ def primary_mirror_deployment(scene):
         )
     
     # Final confirmation with dramatic effect
-    confirm_text = Text("PRIMARY MIRROR DEPLOYED", font_size=24, color=GREEN)
+    confirm_text = cached_text("PRIMARY MIRROR DEPLOYED", font_size=24, color=GREEN)
     confirm_text.next_to(primary_mirror_group, DOWN, buff=0.5)
     
     # Add a success icon
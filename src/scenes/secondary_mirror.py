@@ -1,5 +1,8 @@
 import numpy as np
 from manim import *
+from src.utils.glow import Glow
+from src.utils.rate_functions import rate_function
+from src.utils.text_cache import cached_text
 SILVER = "#C0C0C0"
 ACCENT_BLUE = "#1E90FF"
 
@@ -32,7 +35,7 @@ def secondary_mirror_deployment(scene):
         # )
         
         # Add glow effect during deployment
-        mirror_glow = secondary_mirror.copy().set_color(YELLOW).set_opacity(0.3)
+        mirror_glow = Glow(secondary_mirror, color=YELLOW, intensity=0.3, fill=True)
         scene.add(mirror_glow)
         
         # Deploy tripod with sequential animation
@@ -40,25 +43,24 @@ def secondary_mirror_deployment(scene):
             angle = i * 2*PI/3
             final_end = 0.8 * np.array([np.cos(angle), np.sin(angle), 0])
             
-            strut_glow = strut.copy().set_color(ACCENT_BLUE).set_opacity(0.5)
+            strut_glow = Glow(strut, color=ACCENT_BLUE, intensity=0.5)
             scene.add(strut_glow)
             
             scene.play(
                 strut.animate.put_start_and_end_on(ORIGIN, final_end),
-                strut_glow.animate.put_start_and_end_on(ORIGIN, final_end),
                 run_time=1.5,
-                rate_func=smooth
+                rate_func=rate_function("smooth_deployment")
             )
             scene.remove(strut_glow)
         
         # Final adjustment with emphasis
         scene.play(
             secondary_mirror.animate.scale(1.2),
-            mirror_glow.animate.scale(1.2).set_opacity(0.2),
+            mirror_glow.animate.set_opacity(0.2),
             run_time=1.5
         )
         scene.remove(mirror_glow)
         
         # Add deployment confirmation with style
-        confirm_text = Text("SECONDARY MIRROR DEPLOYED", font_size=24, color=GREEN)
+        confirm_text = cached_text("SECONDARY MIRROR DEPLOYED", font_size=24, color=GREEN)
         confirm_text.next_to(secondary_system, DOWN, buff=0.5)
\ No newline at end of file
@@ -1,5 +1,10 @@
 import numpy as np
 from manim import *
+from src.utils.glow import Glow
+from src.utils.hud import MissionHUD
+from src.utils.layers import set_layer
+from src.utils.rate_functions import rate_function
+from src.utils.text_cache import cached_text
 SILVER = "#C0C0C0"
 ACCENT_BLUE = "#1E90FF"    
 
@@ -18,42 +23,50 @@ def sunshield_deployment(scene):
 
     scene.add(jwst)
 
+    # Mission clock, status and progress, kept in the corners of the frame
+    hud = MissionHUD(scene.camera.frame)
+    set_layer("hud", hud)
+    scene.add(hud)
+
     # Camera cinematic intro shot
     scene.play(
         scene.camera.frame.animate.move_to(jwst.get_center()).scale(1.25),
         run_time=3,
-        rate_func=smooth
+        rate_func=rate_function("smooth_deployment")
     )
     scene.wait(0.5)
 
     # --- SOLAR PANEL DEPLOYMENT ---
     scene.play(
         solar_panel.animate.scale(1.4).set_opacity(1),
+        hud.advance("solar_array"),
         scene.camera.frame.animate.move_to(jwst.get_center()).scale(1.15),
         run_time=2.5,
-        rate_func=smooth
+        rate_func=rate_function("smooth_deployment")
     )
 
     # --- DTA EXTENSION WITH GLOW ---
-    dta_glow = dta_tower.copy().set_color(ACCENT_BLUE).set_opacity(0.25)
+    dta_glow = Glow(dta_tower, color=ACCENT_BLUE, intensity=0.25, fill=True)
     scene.add(dta_glow)
     scene.play(
         # mirror_boom.animate.stretch(2.5, 1, about_point=bus.get_top()),
         dta_tower.animate.stretch(2.3, 1, about_point=bus.get_top()),
-        dta_glow.animate.stretch(2.3, 1, about_point=bus.get_top()).set_opacity(0.05),
+        dta_glow.animate.set_opacity(0.05),
+        hud.advance("dta_extension"),
         scene.camera.frame.animate.move_to(jwst.get_center()).scale(1.0),
         run_time=3,
-        rate_func=smooth
+        rate_func=rate_function("smooth_deployment")
     )
     scene.remove(dta_glow)
 
     # --- SUNSHIELD DEPLOYMENT ---
     deploy_anims = []
-    glow_layers = VGroup()
+    glow_layers = Group()
 
     for i, layer in enumerate(sunshield_layers):
         layer.set_opacity(0.4)
-        glow = layer.copy().set_color(ACCENT_BLUE).set_opacity(0.15)
+        # Grows with its layer; spread adds the extra 5% the old copies had
+        glow = Glow(layer, color=ACCENT_BLUE, intensity=0.15, fill=True, spread=1.05)
         glow_layers.add(glow)
 
         deploy_anims.append(
@@ -67,7 +80,8 @@ def sunshield_deployment(scene):
     scene.add(glow_layers)
     scene.play(
         LaggedStart(*deploy_anims, lag_ratio=0.25),
-        glow_layers.animate.scale(4.2).set_opacity(0.05),
+        *[glow.animate.set_opacity(0.05) for glow in glow_layers],
+        hud.advance("mid_boom_extension"),
         scene.camera.frame.animate.move_to(jwst.get_center() + DOWN * 0.5).scale(0.9),
         run_time=5
     )
@@ -76,33 +90,37 @@ def sunshield_deployment(scene):
     # --- MID-BOOM EXTENSION (TENSIONING) ---
     scene.play(
         sunshield_layers.animate.stretch(1.25, 0, about_point=sunshield_layers.get_center()),
+        hud.advance("sunshield_tensioning"),
         scene.camera.frame.animate.move_to(jwst.get_center() + UP * 0.3).scale(0.85),
         run_time=2
     )
 
     # --- LAYER HIGHLIGHTING ---
     for i, layer in enumerate(sunshield_layers):
-        label = Text(f"Layer {i+1}", font_size=20, color=WHITE)
+        label = cached_text(f"Layer {i+1}", font_size=20, color=WHITE)
         label.next_to(layer.get_corner(UR), UR, buff=0.1)
 
-        glow = layer.copy().set_color(ACCENT_BLUE).set_opacity(0.3)
+        glow = Glow(layer, color=ACCENT_BLUE, intensity=0.3, fill=True)
         scene.add(glow)
 
         scene.play(
             FadeIn(label, shift=UP*0.2),
             layer.animate.set_opacity(1).scale(1.05),
-            glow.animate.scale(1.1).set_opacity(0.05),
+            glow.animate.scale(1.05).set_opacity(0.05),
             run_time=1
         )
         scene.play(FadeOut(label), FadeOut(glow), run_time=0.6)
 
     # --- CINEMATIC OUTRO SHOT ---
-    final_glow = sunshield_layers.copy().set_color(ACCENT_BLUE).set_opacity(0.08)
+    final_glow = Glow(sunshield_layers, color=ACCENT_BLUE, intensity=0.08, fill=True)
     scene.add(final_glow)
     scene.play(
         scene.camera.frame.animate.move_to(jwst.get_center()).scale(0.9),
+        # The HUD goes in the first 0.6 s of the shot
+        FadeOut(hud, rate_func=squish_rate_func(smooth, 0, 0.2)),
         run_time=3
     )
+    scene.remove(hud)
     scene.wait(2)
     scene.remove(final_glow)
 
@@ -5,13 +5,17 @@ Helper functions for common deployment animations
 
 from manim import *
 import numpy as np
+from src.utils.arc_length import arc_length_path
+from src.utils.holds import background_updater
+from src.utils.rate_functions import lookup_rate_func, rate_function
+from src.utils.text_cache import cached_text
 
 def rotate_about_point(scene, mobject, hinge_point, angle, run_time=1.2):
     """Rotate a mobject about a specific hinge point"""
     scene.play(
         Rotate(mobject, angle=angle, about_point=hinge_point),
         run_time=run_time,
-        rate_func=smooth
+        rate_func=rate_function("smooth_deployment")
     )
 
 def extend_boom(scene, boom, direction, distance, run_time=1.5):
@@ -19,7 +23,7 @@ def extend_boom(scene, boom, direction, distance, run_time=1.5):
     scene.play(
         boom.animate.shift(direction * distance),
         run_time=run_time,
-        rate_func=smooth
+        rate_func=rate_function("smooth_deployment")
     )
 
 def tension_layers_staggered(scene, layers, scale_factor=1.02, opacity=1.0, lag_ratio=0.2, run_time=2.5):
@@ -27,7 +31,7 @@ def tension_layers_staggered(scene, layers, scale_factor=1.02, opacity=1.0, lag_
     animations = []
     for layer in layers:
         animations.append(
-            layer.animate.set_opacity(opacity).scale(scale_factor)
+            layer.animate(rate_func=rate_function("smooth_deployment")).set_opacity(opacity).scale(scale_factor)
         )
     
     scene.play(
@@ -42,11 +46,39 @@ def deploy_mirror_wing(scene, wing, center_point, angle, run_time=3.0):
             wing,
             angle=angle,
             about_point=center_point,
-            rate_func=smooth
+            rate_func=rate_function("smooth_deployment")
         ),
         run_time=run_time
     )
 
+class MoveAlongArcLength(MoveAlongPath):
+    """MoveAlongPath at constant speed, read from the path's cached arc-length table.
+
+    The table (see src/utils/arc_length.py) is taken when the animation
+    begins and shared with every other animation along the same points,
+    so each frame is one lookup instead of point_from_proportion measuring
+    the whole path. With follow_tangent the mobject also turns with the
+    direction of travel, starting from its current orientation.
+    """
+
+    def __init__(self, mobject, path, follow_tangent=False, **kwargs):
+        self.follow_tangent = follow_tangent
+        super().__init__(mobject, path, **kwargs)
+
+    def begin(self):
+        self.arc_path = arc_length_path(self.path)
+        self.heading = None
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        proportion = self.rate_func(alpha)
+        self.mobject.move_to(self.arc_path.point_at(proportion))
+        if self.follow_tangent:
+            heading = angle_of_vector(self.arc_path.tangent_at(proportion))
+            if self.heading is not None:
+                self.mobject.rotate(heading - self.heading)
+            self.heading = heading
+
 def create_deployment_path(start_point, end_point, curve_factor=0.5):
     """Create a curved Bezier path for deployment animations"""
     control_point = (start_point + end_point) / 2 + UP * curve_factor
@@ -60,9 +92,9 @@ def create_deployment_path(start_point, end_point, curve_factor=0.5):
 def animate_along_path(scene, mobject, path, run_time=2.0, rate_func=smooth):
     """Animate a mobject along a curved path"""
     scene.play(
-        MoveAlongPath(mobject, path),
+        MoveAlongArcLength(mobject, path),
         run_time=run_time,
-        rate_func=rate_func
+        rate_func=lookup_rate_func(rate_func)
     )
 
 def create_expanding_circle_reveal(scene, center, max_radius, objects_to_reveal, run_time=2.0):
@@ -86,17 +118,65 @@ def create_hud_update_animation(scene, value_tracker, new_value, display_text, r
         rate_func=linear
     )
 
+class ParallaxShift(Animation):
+    """Shift every star of a StarField by vector times its depth factor.
+
+    Equivalent to a LaggedStart of one shift per star (each lasting
+    star_run_time, each with rate_func), but the whole field moves with one
+    array operation per frame.
+    """
+
+    def __init__(self, starfield, vector, lag_ratio=0, star_run_time=1, run_time=None, **kwargs):
+        star_count = len(starfield.points)
+        if run_time is None:
+            run_time = star_run_time * (1 + (star_count - 1) * lag_ratio)
+        self.displacements = np.outer(starfield.depths, vector)
+        self.start_delays = np.arange(star_count) * lag_ratio
+        super().__init__(starfield, lag_ratio=lag_ratio, run_time=run_time, **kwargs)
+
+    def begin(self):
+        self.start_points = self.mobject.points.copy()
+        self.star_rate_func = lookup_rate_func(self.rate_func)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        full_length = 1 + (len(self.start_delays) - 1) * self.lag_ratio
+        star_alphas = np.clip(alpha * full_length - self.start_delays, 0, 1)
+        progress = self.star_rate_func(star_alphas)
+        self.mobject.points = self.start_points + progress[:, None] * self.displacements
+
 def parallax_star_movement(scene, stars, direction, distance, run_time=3.0):
     """Create parallax movement effect for background stars"""
-    animations = []
-    
-    for i, star in enumerate(stars):
-        # Vary movement based on star "depth" (opacity suggests distance)
-        depth_factor = star.fill_opacity
-        movement = direction * distance * depth_factor
-        animations.append(star.animate.shift(movement))
-    
-    scene.play(*animations, run_time=run_time, rate_func=linear)
+    # Nearer stars (larger depth factor) move further
+    scene.play(
+        ParallaxShift(stars, direction * distance),
+        run_time=run_time,
+        rate_func=linear
+    )
+
+def add_twinkle(stars, seed=0, min_opacity=0.3, frequency_range=(0.5, 1.5)):
+    """Make every star of a StarField twinkle with one batched updater.
+
+    Each star gets a fixed frequency and phase from seed (an int or a
+    random_stream generator), so the flicker is the same on every render. All opacities are computed in
+    one vectorized step per frame and written straight into the alpha channel. The twinkle
+    is a background updater, paused during waits when HOLDS["freeze_background"] is on.
+    """
+    rng = np.random.default_rng(seed)
+    star_count = len(stars.points)
+    frequencies = rng.uniform(*frequency_range, star_count)
+    phases = rng.uniform(0, PI, star_count)
+    elapsed = 0.0
+
+    def twinkle(mob, dt):
+        nonlocal elapsed
+        elapsed += dt
+        mob.rgbas[:, 3] = min_opacity + (1 - min_opacity) * np.abs(
+            np.sin(2 * PI * frequencies * elapsed + phases)
+        )
+
+    stars.add_updater(background_updater(twinkle))
+    return twinkle
 
 def create_focusing_effect(scene, blurry_objects, sharp_objects, run_time=2.0):
     """Simulate wavefront sensing and focusing"""
@@ -105,7 +185,7 @@ def create_focusing_effect(scene, blurry_objects, sharp_objects, run_time=2.0):
         *[FadeOut(obj) for obj in blurry_objects],
         *[FadeIn(obj) for obj in sharp_objects],
         run_time=run_time,
-        rate_func=smooth
+        rate_func=rate_function("smooth_deployment")
     )
 
 def create_measurement_line(start_point, end_point, label_text, color=WHITE):
@@ -128,7 +208,7 @@ def create_measurement_line(start_point, end_point, label_text, color=WHITE):
     )
     
     # Label at midpoint
-    label = Text(label_text, font_size=14, color=color)
+    label = cached_text(label_text, font_size=14, color=color)
     label.next_to(line.get_center(), UP, buff=0.1)
     
     return Group(line, start_tick, end_tick, label)
@@ -138,12 +218,12 @@ def create_pulse_animation(scene, mobject, scale_factor=1.2, run_time=0.8):
     scene.play(
         mobject.animate.scale(scale_factor),
         run_time=run_time/2,
-        rate_func=rush_into
+        rate_func=rate_function("tension")
     )
     scene.play(
         mobject.animate.scale(1/scale_factor),
         run_time=run_time/2,
-        rate_func=rush_from
+        rate_func=rate_function("settle")
     )
 
 def create_spiral_deployment(scene, objects, center_point, spiral_turns=2, run_time=3.0):
@@ -172,10 +252,10 @@ def create_spiral_deployment(scene, objects, center_point, spiral_turns=2, run_t
         path.set_points_as_corners(path_points)
         path.make_smooth()
         
-        animations.append(MoveAlongPath(obj, path))
+        animations.append(MoveAlongArcLength(obj, path))
     
     scene.play(
         *animations,
         run_time=run_time,
-        rate_func=smooth
+        rate_func=rate_function("smooth_deployment")
     )
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+JWST Arc-Length Paths
+Dense arc-length tables of VMobject paths, for constant-speed sampling by proportion
+"""
+
+import hashlib
+from bisect import bisect_right
+
+import numpy as np
+
+from src.utils.constants import ARC_LENGTH
+
+# Tables already built in this process, by the path's points and sampling
+_paths = {}
+
+
+class ArcLengthPath:
+    """Points and unit tangents of a path, looked up by proportion of its length.
+
+    Every cubic curve of the path is evaluated at samples_per_curve
+    parameters in one vectorized step, once. A lookup is then a binary
+    search in the cumulative lengths and a linear interpolation, instead
+    of point_from_proportion measuring every curve on every call. Unlike
+    point_from_proportion, equal steps in proportion are equal distances
+    along the path within a curve too. Jumps between subpaths add no length.
+    """
+
+    def __init__(self, path, samples_per_curve=ARC_LENGTH["samples_per_curve"]):
+        curves = np.asarray(path.get_cubic_bezier_tuples(), dtype=float)
+        if len(curves) == 0:
+            raise ValueError("ArcLengthPath needs a path with at least one curve")
+        t = np.linspace(0, 1, samples_per_curve + 1)[:, None]
+        weights = np.hstack([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3])
+        derivative_weights = np.hstack([(1 - t) ** 2, 2 * (1 - t) * t, t ** 2])
+        # (curve, sample, xyz)
+        points = np.einsum("sk,ckd->csd", weights, curves)
+        derivatives = np.einsum("sk,ckd->csd", derivative_weights, np.diff(curves, axis=1))
+
+        steps = np.linalg.norm(np.diff(points, axis=1), axis=2)
+        lengths = np.concatenate([np.zeros((len(curves), 1)), np.cumsum(steps, axis=1)], axis=1)
+        lengths += np.concatenate([[0], np.cumsum(lengths[:-1, -1])])[:, None]
+
+        self.length = lengths[-1, -1]
+        self.points = points.reshape(-1, 3)
+        norms = np.linalg.norm(derivatives, axis=2).reshape(-1, 1)
+        self.tangents = np.divide(derivatives.reshape(-1, 3), norms, out=np.zeros_like(self.points), where=norms > 0)
+        self.proportions = lengths.ravel() / self.length if self.length > 0 else np.linspace(0, 1, lengths.size)
+        # A single proportion (once per frame) is looked up without array overhead
+        self.proportion_list = self.proportions.tolist()
+
+    def _locate(self, proportion):
+        """Sample index before each proportion and the fraction of the way to the next sample"""
+        if np.ndim(proportion) == 0:
+            proportion = min(max(float(proportion), 0.0), 1.0)
+            index = min(max(bisect_right(self.proportion_list, proportion) - 1, 0), len(self.proportion_list) - 2)
+            start, end = self.proportion_list[index], self.proportion_list[index + 1]
+            return index, (proportion - start) / (end - start) if end > start else 0.0
+        proportion = np.clip(proportion, 0, 1)
+        index = np.clip(np.searchsorted(self.proportions, proportion, side="right") - 1, 0, len(self.proportions) - 2)
+        span = self.proportions[index + 1] - self.proportions[index]
+        fraction = np.divide(proportion - self.proportions[index], span, out=np.zeros_like(span), where=span > 0)
+        return index, np.asarray(fraction)[..., None]
+
+    def point_at(self, proportion):
+        """Point (or array of points) at proportion (0 to 1, or an array) of the path's length"""
+        index, fraction = self._locate(proportion)
+        return self.points[index] + fraction * (self.points[index + 1] - self.points[index])
+
+    def tangent_at(self, proportion):
+        """Unit direction of travel at proportion of the path's length"""
+        index, fraction = self._locate(proportion)
+        tangent = self.tangents[index] + fraction * (self.tangents[index + 1] - self.tangents[index])
+        norm = np.linalg.norm(tangent, axis=-1, keepdims=True)
+        return np.divide(tangent, norm, out=np.zeros_like(tangent), where=norm > 0)
+
+
+def arc_length_path(path, samples_per_curve=ARC_LENGTH["samples_per_curve"]):
+    """The ArcLengthPath of path as it is now, shared by every animation along the same points"""
+    key = (hashlib.sha1(np.ascontiguousarray(path.points, dtype=float).tobytes()).hexdigest(), samples_per_curve)
+    if key not in _paths:
+        _paths[key] = ArcLengthPath(path, samples_per_curve)
+    return _paths[key]
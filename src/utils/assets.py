@@ -0,0 +1,60 @@
+"""
+JWST Asset Loading
+Logo line-art parsed once and cached on disk as ready-to-draw subpaths
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from manim import *
+import numpy as np
+
+from src.utils.constants import ASSET_CACHE
+
+# Processed logos already loaded in this process, by cache key
+_loaded_logos = {}
+
+
+def _logo_cache_key(svg_path, color, stroke_width, scale, shift):
+    digest = hashlib.sha256(Path(svg_path).read_bytes())
+    style = [str(ManimColor(color)), stroke_width, scale, np.round(shift, 6).tolist()]
+    digest.update(repr(style).encode())
+    return digest.hexdigest()[:20]
+
+
+def _build_logo_subpaths(svg_path, color, stroke_width, scale, shift):
+    """Parse the SVG and return the points of every drawable subpath, sorted"""
+    svg_logo = SVGMobject(svg_path)
+    svg_logo.scale(scale).shift(shift)
+    parts = [m for m in svg_logo.family_members_with_points() if len(m.get_points()) > 0]
+    parts.sort(key=lambda p: (np.round(p.get_center()[0], 2), np.round(p.get_center()[1], 2)))
+    return [np.array(part.get_points()) for part in parts]
+
+
+def load_logo_parts(svg_path="assets/logo.svg", color=GOLD, stroke_width=6, scale=1.2, shift=ORIGIN):
+    """Logo line-art as a VGroup of stroked subpaths, sorted left to right.
+
+    The parsed and sorted subpath geometry is cached on disk, keyed by the
+    SVG file hash and the style parameters, so only the first run pays the
+    SVG parse. Every call returns a fresh copy that can be animated freely.
+    """
+    key = _logo_cache_key(svg_path, color, stroke_width, scale, shift)
+    if key not in _loaded_logos:
+        cache_file = Path(config.get_dir("media_dir")) / ASSET_CACHE["directory"] / f"logo_{key}.npz"
+        if cache_file.exists():
+            with np.load(cache_file) as data:
+                subpaths = [data[f"arr_{i}"] for i in range(len(data.files))]
+        else:
+            subpaths = _build_logo_subpaths(svg_path, color, stroke_width, scale, shift)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Parallel workers replay the intro and outro at once: write aside, then move into place
+            temporary = cache_file.with_name(f"{cache_file.stem}_{os.getpid()}.tmp")
+            with open(temporary, "wb") as f:
+                np.savez(f, *subpaths)
+            os.replace(temporary, cache_file)
+
+        parts = [VMobject().set_points(points) for points in subpaths]
+        _loaded_logos[key] = VGroup(*parts).set_fill(opacity=0).set_stroke(color, width=stroke_width)
+
+    return _loaded_logos[key].copy()
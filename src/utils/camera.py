@@ -0,0 +1,193 @@
+"""
+JWST Camera
+MovingCamera with fast paths for the project's array-backed mobjects
+"""
+
+from manim import *
+import numpy as np
+
+from src.utils.glow import Glow
+from src.utils.layers import mobject_layers
+from src.utils.profiler import timed_phase
+from src.utils.starfield import StarField
+from src.utils.static_layer import StaticLayer
+
+
+class DeploymentCamera(MovingCamera):
+    """MovingCamera that draws each StarField in one vectorized pass, Glows and StaticLayers"""
+
+    def type_or_raise(self, mobject):
+        # The base class rebuilds display_funcs on every call
+        mobject_type = super().type_or_raise(mobject)
+        self.display_funcs[StarField] = self.display_multiple_starfields
+        self.display_funcs[Glow] = self.display_multiple_glows
+        self.display_funcs[StaticLayer] = self.display_multiple_static_layers
+        for project_type in [StarField, Glow, StaticLayer]:
+            if isinstance(mobject, project_type):
+                return project_type
+        return mobject_type
+
+    # Only mobjects on this layer are drawn (see src/utils/layers.py); None draws all
+    render_layer = None
+    # Top-level mobjects of the scene being drawn, set by the renderer for
+    # each frame: the lists it passes in are flattened families, which
+    # have lost the parents the layers are inherited from
+    layer_roots = None
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        mobjects = list(mobjects)
+        to_display = super().get_mobjects_to_display(mobjects, include_submobjects, excluded_mobjects)
+        if self.render_layer is None:
+            return to_display
+        layers = mobject_layers(self.layer_roots if self.layer_roots is not None else mobjects)
+        return [mobject for mobject in to_display if layers.get(id(mobject)) == self.render_layer]
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        with timed_phase("raster"):
+            super().capture_mobjects(mobjects, **kwargs)
+
+    def display_multiple_starfields(self, starfields, pixel_array):
+        for starfield in starfields:
+            self.display_starfield(starfield, pixel_array)
+
+    def display_starfield(self, starfield, pixel_array):
+        """Alpha-blend every star of a StarField straight into the pixel array.
+
+        Each star is drawn as an antialiased disc. Stars are grouped by
+        footprint size so the work per group is a handful of array operations,
+        whatever the number of stars.
+        """
+        points = starfield.points
+        if len(points) == 0:
+            return
+
+        pixel_height, pixel_width = pixel_array.shape[:2]
+        units_to_pixels = pixel_width / self.frame_width
+        shifted = points - self.frame_center
+        x = shifted[:, 0] * units_to_pixels + pixel_width / 2
+        y = -shifted[:, 1] * (pixel_height / self.frame_height) + pixel_height / 2
+        radii = starfield.radii * units_to_pixels
+        alphas = starfield.rgbas[:, 3]
+
+        margin = radii + 1
+        visible = (
+            (alphas > 0)
+            & (x > -margin) & (x < pixel_width + margin)
+            & (y > -margin) & (y < pixel_height + margin)
+        )
+        if not visible.any():
+            return
+
+        x, y, radii = x[visible], y[visible], radii[visible]
+        colors = starfield.rgbas[visible, :3]
+        alphas = alphas[visible]
+        footprints = np.ceil(radii + 0.5).astype(int)
+
+        indices, weights = [], []
+        for footprint in np.unique(footprints):
+            group = footprints == footprint
+            offsets = np.arange(-footprint, footprint + 1)
+            offset_x, offset_y = (o.ravel() for o in np.meshgrid(offsets, offsets))
+
+            px = np.floor(x[group]).astype(int)[:, None] + offset_x
+            py = np.floor(y[group]).astype(int)[:, None] + offset_y
+            distance = np.hypot(px + 0.5 - x[group][:, None], py + 0.5 - y[group][:, None])
+            coverage = np.clip(radii[group][:, None] + 0.5 - distance, 0, 1)
+
+            # Sub-pixel stars: keep the light they cover equal to the disc area
+            area = np.pi * radii[group] ** 2
+            total = coverage.sum(axis=1)
+            small = (total > area) & (total > 0)
+            coverage[small] *= (area[small] / total[small])[:, None]
+
+            on_screen = (px >= 0) & (px < pixel_width) & (py >= 0) & (py < pixel_height) & (coverage > 0)
+            star_index = np.broadcast_to(np.nonzero(group)[0][:, None], coverage.shape)
+            indices.append(np.stack([(py * pixel_width + px)[on_screen], star_index[on_screen]]))
+            weights.append((coverage * alphas[group][:, None])[on_screen])
+
+        pixel_index, star_index = np.concatenate(indices, axis=1)
+        weights = np.concatenate(weights)
+        if len(weights) == 0:
+            return
+
+        # Sum the light of all stars landing on each touched pixel
+        pixels, inverse = np.unique(pixel_index, return_inverse=True)
+        opacity = np.bincount(inverse, weights=weights)
+        light = np.stack(
+            [np.bincount(inverse, weights=weights * colors[star_index, c]) for c in range(3)],
+            axis=1,
+        )
+        clipped = np.minimum(opacity, 1)
+        light *= (clipped / opacity)[:, None]
+
+        flat = pixel_array.reshape((pixel_height * pixel_width, pixel_array.shape[2]))
+        touched = flat[pixels].astype(float)
+        touched[:, :3] = touched[:, :3] * (1 - clipped[:, None]) + self.rgb_max_val * light
+        touched[:, 3] = touched[:, 3] * (1 - clipped) + self.rgb_max_val * clipped
+        flat[pixels] = touched.astype(self.pixel_array_dtype)
+
+    def display_multiple_glows(self, glows, pixel_array):
+        ctx = self.get_cairo_context(pixel_array)
+        for glow in glows:
+            self.display_glow(glow, ctx)
+
+    def display_glow(self, glow, ctx):
+        """Stroke (and optionally fill) the source's paths in the glow color.
+
+        The halo is a stack of strokes, widest first, each adding a share of
+        the intensity, so it is brightest along the source's outline.
+        """
+        if glow.intensity <= 0:
+            return
+        # Cairo's ARGB32 surface takes the channels in reverse order
+        red, green, blue = glow.glow_color.to_rgb()
+        for vmobject, points in glow.get_paths():
+            ctx.new_path()
+            for subpath in vmobject.gen_subpaths_from_points_2d(points):
+                ctx.new_sub_path()
+                ctx.move_to(*subpath[0][:2])
+                for _p0, p1, p2, p3 in vmobject.gen_cubic_bezier_tuples_from_points(subpath):
+                    ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
+                if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+                    ctx.close_path()
+
+            if glow.fill:
+                ctx.set_source_rgba(blue, green, red, glow.intensity)
+                ctx.fill_preserve()
+            for step in range(glow.passes, 0, -1):
+                ctx.set_source_rgba(blue, green, red, glow.intensity / glow.passes)
+                ctx.set_line_width(glow.glow_width * step / glow.passes * self.cairo_line_width_multiple)
+                ctx.stroke_preserve()
+            ctx.new_path()
+
+    def display_multiple_static_layers(self, layers, pixel_array):
+        for layer in layers:
+            self.display_static_layer(layer, pixel_array)
+
+    def display_static_layer(self, layer, pixel_array):
+        """Blit the visible part of a StaticLayer's raster, scaled to the camera frame"""
+        if layer.layer_opacity <= 0:
+            return
+        pixel_height, pixel_width = pixel_array.shape[:2]
+        scale = np.array([pixel_width / self.frame_width, -pixel_height / self.frame_height])
+        center = np.array([pixel_width / 2, pixel_height / 2])
+        (left, top), (right, bottom) = (layer.points[:, :2] - self.frame_center[:2]) * scale + center
+
+        x0, y0 = max(0, int(np.floor(left))), max(0, int(np.floor(top)))
+        x1, y1 = min(pixel_width, int(np.ceil(right))), min(pixel_height, int(np.ceil(bottom)))
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        # The same pixel rectangle in raster coordinates
+        image = layer.get_image()
+        image_scale = np.array([image.width / (right - left), image.height / (bottom - top)])
+        corners = (np.array([[x0, y0], [x1, y1]]) - [left, top]) * image_scale
+        box = tuple(corners.ravel())
+        tile = layer.get_tile((x1 - x0, y1 - y0), box)
+        if layer.layer_opacity < 1:
+            tile = (tile * layer.layer_opacity).astype(self.pixel_array_dtype)
+
+        # Premultiplied "over": the tile plus what it lets through
+        region = pixel_array[y0:y1, x0:x1]
+        alpha = tile[..., 3:].astype(np.uint16)
+        region[:] = tile + (region * (self.rgb_max_val - alpha) + self.rgb_max_val // 2) // self.rgb_max_val
@@ -0,0 +1,128 @@
+"""
+JWST Scene Complexity
+Scene-graph size of every play()/wait(), checked against per-chapter budgets
+"""
+
+import json
+from pathlib import Path
+
+from manim import *
+
+from src.utils.constants import COMPLEXITY
+from src.utils.glow import Glow
+from src.utils.profiler import caller_line
+from src.utils.starfield import StarField
+from src.utils.static_layer import StaticLayer
+
+COMPLEXITY_FILE = Path(__file__).resolve()
+METRICS = ["family", "points", "updaters", "raster_cost", "leftovers"]
+
+# Estimated raster cost, in Bezier curves drawn (one fill or one stroke of a curve)
+STAR_COST = 0.02  # stars are drawn in one vectorized pass per StarField
+BLIT_COST = 50  # one StaticLayer blit
+
+
+def vmobject_cost(vmobject):
+    """Curves Cairo fills and strokes to draw vmobject itself"""
+    curves = len(vmobject.points) // vmobject.n_points_per_cubic_curve
+    stroked = vmobject.get_stroke_width() > 0 and vmobject.get_stroke_opacity() > 0
+    passes = (vmobject.get_fill_opacity() > 0) + stroked
+    return curves * passes
+
+
+def raster_cost(mobject):
+    """Estimated cost of drawing mobject itself (not its submobjects)"""
+    if isinstance(mobject, Glow):
+        if mobject.intensity <= 0:
+            return 0
+        sources = [m for m in mobject.source.family_members_with_points() if isinstance(m, VMobject)]
+        curves = sum(len(m.points) // m.n_points_per_cubic_curve for m in sources)
+        return curves * (mobject.passes + mobject.fill)
+    if isinstance(mobject, StarField):
+        return len(mobject.points) * STAR_COST
+    if isinstance(mobject, StaticLayer):
+        return BLIT_COST
+    if isinstance(mobject, VMobject):
+        return vmobject_cost(mobject)
+    return len(mobject.points)
+
+
+def chapter_budgets(chapter, budgets=COMPLEXITY["budgets"]):
+    """The default budgets, overridden by the chapter's own"""
+    return {**budgets["default"], **budgets.get(chapter, {})}
+
+
+class ComplexityAnalyzer:
+    """Measures the scene graph at the start of every play()/wait().
+
+    Taken once the animations have begun, so mobjects they add (FadeIn,
+    Create) are counted: family size, points, active updaters and the
+    estimated raster cost. At the end of a chapter the peaks, and how many
+    mobjects the chapter left behind, are checked against its budgets.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.records = []
+        self.chapters = {}
+        begin_animations = scene.begin_animations
+
+        def measured_begin_animations():
+            begin_animations()
+            self.measure()
+
+        scene.begin_animations = measured_begin_animations
+
+    def measure(self):
+        scene = self.scene
+        family = scene.get_mobject_family_members()
+        self.records.append({
+            "index": len(self.records),
+            "chapter": getattr(scene, "chapter_name", None),
+            "line": caller_line(COMPLEXITY_FILE),
+            "animations": " ".join(type(a).__name__ for a in scene.animations or []),
+            "family": len(family),
+            "points": sum(len(m.points) for m in family),
+            "updaters": len(scene.updaters) + sum(len(m.updaters) for m in family),
+            "raster_cost": round(sum(raster_cost(m) for m in family)),
+        })
+
+    def begin_chapter(self, name):
+        self.chapters[name] = {"start_family": len(self.scene.get_mobject_family_members())}
+
+    def end_chapter(self, name):
+        """Record the chapter's peaks, warn about (or fail on) every budget it exceeds"""
+        plays = [r for r in self.records if r["chapter"] == name]
+        chapter = self.chapters[name]
+        for metric in METRICS[:-1]:
+            chapter[metric] = max((r[metric] for r in plays), default=0)
+        chapter["leftovers"] = len(self.scene.get_mobject_family_members()) - chapter.pop("start_family")
+
+        budgets = chapter_budgets(name)
+        chapter["over_budget"] = {
+            metric: budgets[metric] for metric in METRICS if metric in budgets and chapter[metric] > budgets[metric]
+        }
+        for metric, budget in chapter["over_budget"].items():
+            worst = max(plays, key=lambda r: r.get(metric, 0), default=None) if metric != "leftovers" else None
+            where = f" (peak at {worst['line']}: {worst['animations']})" if worst else ""
+            message = f"Chapter {name}: {metric} {chapter[metric]} over budget {budget}{where}"
+            if COMPLEXITY["action"] == "fail":
+                raise RuntimeError(message)
+            logger.warning(message)
+
+    def write_report(self, directory=COMPLEXITY["directory"], name="complexity"):
+        """Write every play and the chapter peaks as JSON, log the chapter table"""
+        directory = Path(config.get_dir("media_dir")) / directory
+        directory.mkdir(parents=True, exist_ok=True)
+        report = directory / f"{name}.json"
+        report.write_text(json.dumps({"plays": self.records, "chapters": self.chapters}, indent=1))
+
+        lines = [f"{'family':>7} {'points':>8} {'updaters':>8} {'raster':>8} {'left':>6}  chapter"]
+        for chapter, peaks in self.chapters.items():
+            flag = "  over: " + ", ".join(peaks["over_budget"]) if peaks["over_budget"] else ""
+            lines.append(
+                f"{peaks['family']:7d} {peaks['points']:8d} {peaks['updaters']:8d} {peaks['raster_cost']:8d} "
+                f"{peaks['leftovers']:6d}  {chapter}{flag}"
+            )
+        logger.info("Scene complexity written to %s\n%s", report, "\n".join(lines))
+        return report
@@ -145,4 +145,129 @@ HUD_CONFIG = {
     "progress_position": "LL",
     "info_position": "LR",
     "margin": 0.3
+}
+
+# Render Cache
+# Seed for all random star/nebula geometry (src/utils/rng.py), so renders and cache keys are stable
+RANDOM_SEED = 2021
+
+CHAPTER_CACHE = {
+    "enabled": True,
+    "directory": "chapters"  # under the media directory
+}
+
+ASSET_CACHE = {
+    "directory": "cache",  # under the media directory
+    "text_manifest": "text_manifest.json",  # every Text a render asked for
+    "text_workers": 0  # processes for the Text prewarm, 0 = one per core
+}
+
+# Render Profiler (render.py --profile)
+PROFILER = {
+    "enabled": False,
+    "directory": "profiles",  # under the media directory
+    "top": 15  # plays listed in the summary
+}
+
+# Benchmarks (benchmark.py)
+BENCHMARK = {
+    "baseline": "benchmark_baseline.json",  # relative to the project root
+    "quality": "low_quality",
+    "repeats": 5,  # builder timings keep the fastest of these
+    # Allowed relative change before a result counts as a regression
+    "thresholds": {
+        "seconds": 0.20,  # builder time may grow by 20%
+        "fps": 0.20,  # chapter frames per second may drop by 20%
+        "peak_memory_mb": 0.25,
+        "mobjects": 0.0
+    }
+}
+
+# Timeline dry run (render.py --dry-run)
+TIMELINE = {
+    "directory": "timeline",  # under the media directory
+    "tolerance": 0.1  # chapters may miss their SCENE_DURATIONS budget by 10%
+}
+
+# Narration (audio.py)
+NARRATION = {
+    "script": "jwst_script.txt",
+    "output": "jwst_voice.mp3",
+    "backend": "gtts",  # gtts, pyttsx3 (offline) or stub (silence)
+    "lang": "en",
+    "voice": None,  # backend default
+    "cache_dir": "media/narration",  # one file per synthesized sentence
+    "sentence_pause_ms": 250,
+    "paragraph_pause_ms": 600
+}
+
+# Frame scrubbing (render.py --at)
+SCRUB = {
+    "directory": "scrub",  # under the media directory
+    "proxy_height": 360  # pixel height of preview frames unless --full-res
+}
+
+# Held frames (src/utils/holds.py)
+HOLDS = {
+    "enabled": True,  # encode runs of matching frames once (variable frame rate)
+    "threshold": 2,  # largest per-channel difference (0-255) still counted as the same frame
+    "freeze_background": False  # stop twinkles and pulses during a wait() in which nothing else moves, so it is one held frame
+}
+
+# Static background layer (src/utils/static_layer.py)
+STATIC_LAYER = {
+    "enabled": True,
+    "oversample": 1.5,  # raster resolution relative to the output; chapters never zoom in past the default frame
+    "max_size": 8192,  # largest raster side in pixels
+    "margin": 0.1  # extra units around the mobjects, so stars on the edge are not cut
+}
+
+# Render layers (render.py --layers)
+RENDER_LAYERS = {
+    "order": ["background", "model", "effects", "hud"],  # compositing order, bottom first
+    "default": "model",  # layer of mobjects without one of their own
+    "directory": "layers"  # cached layer videos, under the media directory
+}
+
+# Scene complexity budgets (render.py --complexity)
+COMPLEXITY = {
+    "enabled": False,
+    "action": "warn",  # warn, or fail the render on the first chapter over budget
+    "directory": "complexity",  # under the media directory
+    "budgets": {
+        # Peaks over a chapter's plays; leftovers is how many more family
+        # mobjects the scene holds at the end of the chapter than at its start
+        "default": {"family": 1500, "points": 60000, "updaters": 12, "raster_cost": 20000, "leftovers": 50},
+        # Chapter names override single entries, e.g. the JWST model is left for later chapters
+        "sunshield_deployment": {"leftovers": 200}
+    }
+}
+
+# Chapter snapshots (render.py --from/--to)
+SNAPSHOTS = {
+    "enabled": True,
+    "directory": "snapshots"  # one pickle per chapter boundary, under the media directory
+}
+
+# Frame pipeline (src/utils/frame_pipeline.py)
+FRAME_PIPELINE = {
+    "queue_frames": 8  # frames waiting for the encoder at most (about 33 MB each at 4K)
+}
+
+# Play splitting (render.py --jobs, src/utils/play_split.py)
+PLAY_SPLIT = {
+    "enabled": True,
+    "min_seconds": 4.0,  # plays at least this long are rendered in frame ranges
+    "min_range_frames": 30,  # never cut a play into ranges shorter than this
+    "directory": "play_ranges"
+}
+
+# Rate function lookup tables (src/utils/rate_functions.py)
+RATE_LOOKUP = {
+    "samples": 4096  # table intervals on [0, 1]; interpolation error stays below 1e-6
+}
+
+# Arc-length path tables (src/utils/arc_length.py)
+ARC_LENGTH = {
+    "samples_per_curve": 64  # points evaluated per cubic curve of a path
 }
\ No newline at end of file
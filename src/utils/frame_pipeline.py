@@ -0,0 +1,114 @@
+"""
+JWST Frame Pipeline
+Bounded queue between rasterizing and encoding, with the time each side spends stalled
+"""
+
+import time
+from queue import Queue
+
+from manim import SceneFileWriter, logger
+from manim import __version__ as MANIM_VERSION
+from manim.utils.file_ops import write_to_movie
+
+from src.utils.constants import FRAME_PIPELINE
+from src.utils.holds import HoldFileWriter
+
+
+class TimedQueue(Queue):
+    """Queue that adds the time put() and get() spend blocked to stats"""
+
+    def __init__(self, maxsize, stats):
+        super().__init__(maxsize)
+        self.stats = stats
+
+    def put(self, item, block=True, timeout=None):
+        start = time.perf_counter()
+        super().put(item, block, timeout)
+        self.stats["raster_stall_s"] += time.perf_counter() - start
+        self.stats["peak_queued"] = max(self.stats["peak_queued"], self.qsize())
+
+    def get(self, block=True, timeout=None):
+        start = time.perf_counter()
+        item = super().get(block, timeout)
+        self.stats["encode_stall_s"] += time.perf_counter() - start
+        return item
+
+
+class PipelinedFileWriter(HoldFileWriter):
+    """HoldFileWriter whose writer thread is fed through a bounded queue.
+
+    The scene rasterizes frame N+1 while the writer thread converts and
+    encodes frame N (PyAV releases the GIL while encoding). At most
+    FRAME_PIPELINE["queue_frames"] frames wait in between: when the encoder
+    falls behind, the rasterizer blocks instead of piling up frames in
+    memory. raster_stall_s is the time the rasterizer spent waiting for
+    room in the queue (encoding is the bottleneck), encode_stall_s the
+    time the encoder spent waiting for a frame (rasterizing is).
+
+    If encoding fails, the writer thread keeps taking frames off the queue
+    (so the rasterizer never blocks on it) and the error is raised when the
+    partial movie is closed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.pipeline_stats = {"frames": 0, "raster_stall_s": 0.0, "encode_stall_s": 0.0, "peak_queued": 0}
+        self.writer_error = None
+        super().__init__(*args, **kwargs)
+
+    @property
+    def queue(self):
+        return self._frame_queue
+
+    @queue.setter
+    def queue(self, unbounded_queue):
+        # open_partial_movie_stream creates an unbounded Queue right before
+        # starting the writer thread; a bounded one takes its place
+        self._frame_queue = TimedQueue(FRAME_PIPELINE["queue_frames"], self.pipeline_stats)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if write_to_movie():
+            self.pipeline_stats["frames"] += num_frames
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def listen_and_write(self):
+        try:
+            super().listen_and_write()
+        except Exception as error:
+            self.writer_error = error
+            # Drain up to the end marker close_partial_movie_stream puts
+            while self.queue.get()[1] is not None:
+                pass
+
+    def close_partial_movie_stream(self):
+        try:
+            super().close_partial_movie_stream()
+        finally:
+            error, self.writer_error = self.writer_error, None
+            if error is not None:
+                raise RuntimeError(f"Encoding {self.partial_movie_file_path} failed") from error
+
+    def finish(self):
+        super().finish()
+        stats = self.pipeline_stats
+        if stats["frames"]:
+            logger.info(
+                "Frame pipeline: rasterizer stalled %.2f s on a full queue, encoder idle %.2f s, "
+                "at most %d of %d frames queued",
+                stats["raster_stall_s"], stats["encode_stall_s"], stats["peak_queued"], FRAME_PIPELINE["queue_frames"],
+            )
+
+
+def file_writer_class():
+    """PipelinedFileWriter on Manim 0.19.x, Manim's own SceneFileWriter on any other version.
+
+    It and HoldFileWriter replace internals of 0.19's writer (the queue,
+    the writer thread's loop, the video stream) that later releases
+    rewrote, so elsewhere they would fail or quietly do nothing.
+    """
+    if MANIM_VERSION.split(".")[:2] == ["0", "19"]:
+        return PipelinedFileWriter
+    logger.warning(
+        "Manim %s is not 0.19.x: frame pipeline and held frames are off, using Manim's file writer",
+        MANIM_VERSION,
+    )
+    return SceneFileWriter
@@ -0,0 +1,103 @@
+"""
+JWST Glow
+Halo drawn from another mobject's live geometry instead of a copy of it
+"""
+
+from manim import *
+import numpy as np
+
+
+class Glow(Mobject):
+    """Soft halo around source, drawn by DeploymentCamera as an extra pass.
+
+    The glow keeps a reference to its source instead of copying its points,
+    so it follows every transform of the source for free. Its own state is
+    just color, intensity (peak opacity), width (stroke width of the halo),
+    spread (scale about the source's center) and whether the source's area
+    is filled too; all of it can be animated with ``glow.animate``.
+    ``set_opacity``/``fade`` change the intensity and ``scale`` the spread,
+    so glows animate like the copies they replace.
+    """
+
+    def __init__(self, source, color=YELLOW, intensity=0.3, width=8, spread=1.0, fill=False, passes=3, **kwargs):
+        super().__init__(**kwargs)
+        self.source = source
+        self.glow_color = ManimColor(color)
+        self.intensity = intensity
+        self.glow_width = width
+        self.spread = spread
+        self.fill = fill
+        # Strokes of decreasing width, stacked into a soft falloff
+        self.passes = passes
+
+    def __deepcopy__(self, memo):
+        # Copies (e.g. the targets of .animate) share the source instead of
+        # duplicating it, unless the source itself is part of what is copied
+        memo.setdefault(id(self.source), self.source)
+        return super().__deepcopy__(memo)
+
+    def get_num_points(self):
+        # Counted as drawable whenever the source has geometry
+        return int(any(len(m.points) for m in self.source.get_family()))
+
+    def get_center(self):
+        return self.source.get_center()
+
+    def set_intensity(self, intensity):
+        self.intensity = intensity
+        return self
+
+    def set_width(self, width):
+        self.glow_width = width
+        return self
+
+    def set_color(self, color=YELLOW, family=True):
+        self.glow_color = ManimColor(color)
+        return self
+
+    def set_opacity(self, opacity, family=True):
+        return self.set_intensity(opacity)
+
+    def set_stroke(self, color=None, width=None, opacity=None, **kwargs):
+        if color is not None:
+            self.set_color(color)
+        if width is not None:
+            self.set_width(width)
+        if opacity is not None:
+            self.set_intensity(opacity)
+        return self
+
+    def fade(self, darkness=0.5, family=True):
+        return self.set_intensity(self.intensity * (1 - darkness))
+
+    def scale(self, scale_factor, **kwargs):
+        self.spread *= scale_factor
+        return self
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        self.glow_color = mobject1.glow_color.interpolate(mobject2.glow_color, alpha)
+        self.intensity = interpolate(mobject1.intensity, mobject2.intensity, alpha)
+        self.glow_width = interpolate(mobject1.glow_width, mobject2.glow_width, alpha)
+        self.spread = interpolate(mobject1.spread, mobject2.spread, alpha)
+        return self
+
+    def get_paths(self):
+        """Points of every VMobject of the source, spread about its center"""
+        center = self.source.get_center()
+        for vmobject in self.source.family_members_with_points():
+            if isinstance(vmobject, VMobject):
+                yield vmobject, center + self.spread * (vmobject.points - center)
+
+
+def glows_following(mobjects, moving):
+    """Extend a scene's moving mobjects to glows drawn below a moving source.
+
+    Scene.get_moving_mobjects only redraws mobjects from the first animated
+    one onwards; a glow added before its source would otherwise be frozen
+    into the static background while the source moves.
+    """
+    moving_ids = {id(m) for m in moving}
+    for i, mob in enumerate(mobjects[:len(mobjects) - len(moving)]):
+        if isinstance(mob, Glow) and any(id(m) in moving_ids for m in mob.source.get_family()):
+            return mobjects[i:]
+    return moving
@@ -0,0 +1,123 @@
+"""
+JWST Hex Mirror
+Segmented primary mirror built from an axial hex grid as a few batched VMobjects
+"""
+
+from manim import *
+import numpy as np
+
+# Bezier handles of a straight edge, as fractions along the edge
+LINE_HANDLES = np.array([0, 1 / 3, 2 / 3, 1])
+POINTS_PER_SEGMENT = 6 * len(LINE_HANDLES)
+
+
+def axial_coordinates(rings):
+    """Axial (q, r) coordinates of a hexagon of hex cells, ordered ring by ring"""
+    coords = np.array([
+        (q, r)
+        for q in range(-rings, rings + 1)
+        for r in range(max(-rings, -q - rings), min(rings, -q + rings) + 1)
+    ])
+    q, r = coords[:, 0], coords[:, 1]
+    ring = np.max(np.abs([q, r, q + r]), axis=0)
+    angle = np.arctan2(np.sqrt(3) * (r + q / 2), 1.5 * q) % TAU
+    return coords[np.lexsort((angle, ring))]
+
+
+def hex_segment_points(centers, radius):
+    """Bezier points of flat-topped hexagons at centers, all in one step, shape (N * 24, 3)"""
+    angles = np.arange(6) * TAU / 6
+    corners = radius * np.column_stack([np.cos(angles), np.sin(angles), np.zeros(6)])
+    vertices = centers[:, None, :] + corners[None, :, :]
+    edges = np.roll(vertices, -1, axis=1) - vertices
+    points = vertices[:, :, None, :] + edges[:, :, None, :] * LINE_HANDLES[None, None, :, None]
+    return points.reshape(-1, 3)
+
+
+class HexMirror(VGroup):
+    """Primary mirror whose segments live in shared arrays.
+
+    Segment centers come from axial hex-grid coordinates and every vertex is
+    computed in one vectorized step. The body and each folding wing are a
+    single VMobject with one closed subpath per segment, and the highlights
+    are one VMobject of small circles, so the mirror is a handful of Cairo
+    paths instead of one mobject per segment. Submobjects keep the order
+    (body, wing_left, wing_right, frame, highlights); a segment recolored on
+    its own is an overlay added just before the frame (add_segment_overlay).
+    """
+
+    def __init__(
+        self,
+        rings=2,
+        segment_radius=0.5,
+        gap=0.05,
+        color="#FFD700",
+        fill_opacity=1,
+        stroke_color=WHITE,
+        stroke_width=1.5,
+        highlight_offset=0.15 * UP + 0.1 * RIGHT,
+        highlight_radius=0.04,
+        frame_color="#FFE65B",
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.axial = axial_coordinates(rings)
+        q, r = self.axial[:, 0], self.axial[:, 1]
+        spacing = segment_radius + gap
+        self.centers = np.column_stack([1.5 * spacing * q, np.sqrt(3) * spacing * (r + q / 2), np.zeros(len(q))])
+
+        # The outer columns fold like JWST's wings; everything else is the body
+        self.segment_indices = {
+            "body": np.flatnonzero(np.abs(q) < rings),
+            "wing_left": np.flatnonzero(q == -rings),
+            "wing_right": np.flatnonzero(q == rings),
+        }
+        segment_points = hex_segment_points(self.centers, segment_radius).reshape(len(q), POINTS_PER_SEGMENT, 3)
+
+        def segments(indices):
+            part = VMobject().set_points(segment_points[indices].reshape(-1, 3))
+            part.set_fill(color, opacity=fill_opacity).set_stroke(stroke_color, width=stroke_width)
+            return part
+
+        self.body = segments(self.segment_indices["body"])
+        self.wing_left = segments(self.segment_indices["wing_left"])
+        self.wing_right = segments(self.segment_indices["wing_right"])
+        self.frame = SurroundingRectangle(self.body, buff=0.2, color=frame_color, stroke_width=2).set_opacity(0.3)
+
+        # One glint per body segment (the wings rotate on their own)
+        circle = Circle(radius=1).points
+        glints = self.centers[self.segment_indices["body"]] + highlight_offset
+        self.highlights = VMobject().set_points(
+            (glints[:, None, :] + highlight_radius * circle[None, :, :]).reshape(-1, 3)
+        )
+        self.highlights.set_fill(WHITE, opacity=1).set_stroke(WHITE, width=0)
+
+        self.add(self.body, self.wing_left, self.wing_right, self.frame, self.highlights)
+
+    def locate_segment(self, index):
+        """The part holding segment index and the segment's position within it"""
+        for name in ["body", "wing_left", "wing_right"]:
+            position = np.flatnonzero(self.segment_indices[name] == index)
+            if len(position):
+                return getattr(self, name), position[0]
+        raise IndexError(f"Mirror has no segment {index}")
+
+    def segment_points(self, index):
+        """View of the current points of one segment in its part's point array"""
+        part, position = self.locate_segment(index)
+        return part.points[position * POINTS_PER_SEGMENT:(position + 1) * POINTS_PER_SEGMENT]
+
+    def segment(self, index):
+        """Stand-alone copy of one segment, styled like its part"""
+        part, _ = self.locate_segment(index)
+        return VMobject().set_points(self.segment_points(index).copy()).match_style(part)
+
+    def add_segment_overlay(self, index):
+        """Copy of one segment kept in the mirror over its part, to color that segment on its own.
+
+        It moves and fades with the mirror, and stays under the frame and
+        the highlights like the segment it covers.
+        """
+        overlay = self.segment(index)
+        self.insert(self.submobjects.index(self.frame), overlay)
+        return overlay
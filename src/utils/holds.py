@@ -0,0 +1,144 @@
+"""
+JWST Holds
+Encode runs of unchanged frames once, and optionally freeze background updaters during waits
+"""
+
+import inspect
+from contextlib import contextmanager
+
+import av
+import numpy as np
+from manim import *
+from manim.utils.file_ops import write_to_movie
+
+from src.utils.constants import HOLDS
+
+
+def frames_match(frame, previous, threshold=0):
+    """True if no channel of any pixel differs by more than threshold (0-255)"""
+    if previous is None or frame.shape != previous.shape:
+        return False
+    if np.array_equal(frame, previous):
+        return True
+    if threshold <= 0:
+        return False
+    return np.abs(frame.astype(np.int16) - previous).max() <= threshold
+
+
+class HoldFileWriter(SceneFileWriter):
+    """SceneFileWriter that writes a run of matching frames as one held frame.
+
+    Every frame is given its presentation timestamp on the main thread. A
+    frame that matches the last encoded one (within HOLDS["threshold"]) is
+    not queued at all, it only advances the timestamp, so the previous frame
+    stays on screen until the next one that differs (variable frame rate).
+    When a partial movie ends on a hold, the held frame is written once more
+    at the last timestamp so the file keeps its full length.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.hold_stats = {"frames": 0, "encoded": 0}
+        super().__init__(*args, **kwargs)
+
+    def open_partial_movie_stream(self, file_path=None):
+        super().open_partial_movie_stream(file_path)
+        self.next_pts = 0
+        self.held_frame = None
+        self.held_count = 0
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if not (HOLDS["enabled"] and write_to_movie() and isinstance(frame_or_renderer, np.ndarray)):
+            return super().write_frame(frame_or_renderer, num_frames)
+
+        frame = frame_or_renderer
+        self.hold_stats["frames"] += num_frames
+        if frames_match(frame, self.held_frame, HOLDS["threshold"]):
+            self.held_count += num_frames
+        else:
+            self.queue.put((self.next_pts, frame))
+            self.hold_stats["encoded"] += 1
+            self.held_frame = frame
+            # A frozen frame (wait without updaters) is a hold of its own
+            self.held_count = num_frames - 1
+        self.next_pts += num_frames
+
+    def close_partial_movie_stream(self):
+        if HOLDS["enabled"] and self.held_count:
+            self.queue.put((self.next_pts - 1, self.held_frame))
+            self.hold_stats["encoded"] += 1
+        super().close_partial_movie_stream()
+
+    def listen_and_write(self):
+        if not HOLDS["enabled"]:
+            # write_frame queued (num_frames, frame), as Manim does
+            return super().listen_and_write()
+        while True:
+            pts, frame = self.queue.get()
+            if frame is None:
+                break
+            self.encode_frame_at(frame, pts)
+
+    def encode_frame_at(self, frame, pts):
+        """Encode one frame at pts, in frames since the start of the partial movie.
+
+        Manim's encode_and_write_frame(frame, num_frames) is left as it is
+        for the loop used while holds are off.
+        """
+        av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+        av_frame.pts = pts
+        for packet in self.video_stream.encode(av_frame):
+            self.video_container.mux(packet)
+
+    def finish(self):
+        super().finish()
+        frames, encoded = self.hold_stats["frames"], self.hold_stats["encoded"]
+        if frames:
+            logger.info(
+                "Encoded %d of %d frames, %d (%.0f%%) written as holds",
+                encoded, frames, frames - encoded, 100 * (frames - encoded) / frames,
+            )
+
+
+def background_updater(updater):
+    """Mark an updater as background motion (twinkles, pulses) that may be frozen during waits"""
+    updater.background = True
+    return updater
+
+
+def only_background_moves(scene):
+    """True if background updaters are all that would keep a wait from being static.
+
+    Manim's own test (Scene.should_update_mobjects) with the background
+    updaters left out: no scene updaters, no always_update_mobjects and no
+    other time-based updater on any mobject.
+    """
+    if scene.always_update_mobjects or scene.updaters:
+        return False
+    background = False
+    for mob in scene.get_mobject_family_members():
+        for updater in mob.updaters:
+            if getattr(updater, "background", False):
+                background = True
+            elif "dt" in inspect.signature(updater).parameters:
+                return False
+    return background
+
+
+@contextmanager
+def frozen_background(scene):
+    """Take the background updaters off every mobject of scene until the block ends.
+
+    A wait in which nothing else moves then becomes a static wait, which
+    Manim renders as a single frozen frame.
+    """
+    suspended = []
+    for mob in scene.get_mobject_family_members():
+        background = [updater for updater in mob.updaters if getattr(updater, "background", False)]
+        if background:
+            suspended.append((mob, list(mob.updaters)))
+            mob.updaters = [updater for updater in mob.updaters if updater not in background]
+    try:
+        yield
+    finally:
+        for mob, updaters in suspended:
+            mob.updaters = updaters + [updater for updater in mob.updaters if updater not in updaters]
@@ -0,0 +1,178 @@
+"""
+JWST Mission HUD
+Mission clock, deployment status and progress bar drawn from a glyph atlas
+"""
+
+from manim import *
+import numpy as np
+
+from src.utils.constants import DEPLOYMENT_TIMELINE, HUD_CONFIG
+from src.utils.text_cache import cached_text
+
+ATLAS_CHARS = "0123456789.:+-/ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+CORNERS = {"UL": UL, "UR": UR, "DL": DL, "DR": DR, "LL": DL, "LR": DR}
+
+# Atlases already built in this process, by (font_size, color)
+_atlases = {}
+
+
+class GlyphAtlas:
+    """Outline points of single characters, cut once from one Text.
+
+    Every glyph is stored relative to the center of its cell and the
+    baseline of the Text, so placing one is a single array addition.
+    Characters are laid out monospaced, cell_width apart.
+    """
+
+    def __init__(self, font_size, color):
+        text = cached_text(ATLAS_CHARS, font_size=font_size, color=color)
+        baseline = text.get_center()[1]
+        self.color = ManimColor(color)
+        self.templates = {" ": np.zeros((0, 3))}
+        for char, glyph in zip(ATLAS_CHARS, text.submobjects):
+            self.templates[char] = glyph.points - [glyph.get_center()[0], baseline, 0]
+        self.cell_width = 1.1 * max(glyph.width for glyph in text.submobjects)
+        self.height = text.height
+
+
+def glyph_atlas(font_size=20, color=WHITE):
+    """The atlas for font_size and color, built on first use"""
+    key = (font_size, str(ManimColor(color)))
+    if key not in _atlases:
+        _atlases[key] = GlyphAtlas(font_size, color)
+    return _atlases[key]
+
+
+class GlyphLine(VGroup):
+    """A fixed number of monospaced character cells filled from a GlyphAtlas.
+
+    set_text only rewrites the cells whose character changed, so a clock
+    ticking every frame touches one or two digits instead of laying out a
+    new Text. An invisible anchor box around all cells moves and scales
+    with the line (and gives it its size for layout); new glyphs are
+    placed relative to it.
+    """
+
+    def __init__(self, length, atlas, text="", align=LEFT, **kwargs):
+        super().__init__(**kwargs)
+        self.atlas = atlas
+        self.align = align
+        self.chars = [" "] * length
+        self.anchor = Rectangle(width=length * atlas.cell_width, height=atlas.height, stroke_opacity=0)
+        self.cells = [
+            VMobject(fill_color=atlas.color, fill_opacity=1, stroke_width=0)
+            for _ in range(length)
+        ]
+        self.add(self.anchor, *self.cells)
+        self.set_text(text)
+
+    def set_text(self, text):
+        length = len(self.chars)
+        text = text.upper()[:length]
+        text = text.rjust(length) if np.array_equal(self.align, RIGHT) else text.ljust(length)
+
+        start = self.anchor.get_left()
+        step = (self.anchor.get_right() - start) / length
+        scale = np.linalg.norm(step) / self.atlas.cell_width
+        for i, char in enumerate(text):
+            if char != self.chars[i]:
+                template = self.atlas.templates.get(char, self.atlas.templates[" "])
+                self.cells[i].set_points(start + (i + 0.5) * step + scale * template)
+                self.chars[i] = char
+        return self
+
+
+class MissionHUD(VGroup):
+    """Mission clock, deployment status and progress bar, pinned to the camera frame.
+
+    Everything is driven by ``hud.day``, a ValueTracker in days after
+    launch: animate it directly or with ``hud.advance("dta_extension")``.
+    The status shows the latest milestone of DEPLOYMENT_TIMELINE reached,
+    and the bar the progress towards the last one. The refresh is a plain
+    (not time-based) updater that only rewrites what changed.
+    """
+
+    def __init__(self, frame, timeline=DEPLOYMENT_TIMELINE, font_size=20, **kwargs):
+        super().__init__(**kwargs)
+        self.frame = frame
+        self.milestones = sorted(timeline.items(), key=lambda item: item[1])
+        self.total_days = self.milestones[-1][1]
+        self.day = ValueTracker(0)
+        margin = HUD_CONFIG["margin"]
+
+        clock_label = cached_text("MISSION DAY", font_size=font_size * 0.7, color=SILVER)
+        self.clock = GlyphLine(7, glyph_atlas(font_size, WHITE), align=RIGHT)
+        self.clock.next_to(clock_label, RIGHT, buff=0.2)
+        clock = VGroup(clock_label, self.clock)
+        clock.to_corner(CORNERS[HUD_CONFIG["time_position"]], buff=margin)
+
+        longest = max(len(name) for name, _ in self.milestones)
+        self.status = GlyphLine(longest, glyph_atlas(font_size * 0.8, GOLD), align=RIGHT)
+        self.status.to_corner(CORNERS[HUD_CONFIG["status_position"]], buff=margin)
+
+        self.bar = Rectangle(width=3, height=0.12, stroke_color=SILVER, stroke_width=1.5)
+        self.bar.to_corner(CORNERS[HUD_CONFIG["progress_position"]], buff=margin)
+        self.bar_fill = VMobject(fill_color=GOLD, fill_opacity=0.9, stroke_width=0)
+        ticks = VGroup(*[
+            Line(UP * 0.06, DOWN * 0.06, stroke_width=1, color=SILVER).move_to(self.bar_point(day / self.total_days))
+            for _, day in self.milestones[1:-1]
+        ])
+
+        self.add(clock, self.status, self.bar_fill, self.bar, ticks)
+        # Frame the HUD was laid out in, followed by follow_frame
+        self.frame_state = (np.array(ORIGIN, dtype=float), config.frame_width)
+        self.shown = {}
+        self.follow_frame()
+        self.refresh(self)
+        self.add_updater(self.refresh)
+
+    def __deepcopy__(self, memo):
+        # Copies (the targets of FadeIn/FadeOut) follow the same camera frame
+        memo.setdefault(id(self.frame), self.frame)
+        return super().__deepcopy__(memo)
+
+    def bar_point(self, progress):
+        """Point on the bar's center line, progress (0 to 1) along it"""
+        return interpolate(self.bar.get_left(), self.bar.get_right(), progress)
+
+    def milestone(self, day):
+        """Latest milestone reached on day"""
+        reached = [name for name, milestone_day in self.milestones if milestone_day <= day]
+        return reached[-1] if reached else self.milestones[0][0]
+
+    def advance(self, milestone):
+        """Animation of the clock running on to milestone"""
+        return self.day.animate.set_value(DEPLOYMENT_TIMELINE[milestone])
+
+    def follow_frame(self):
+        """Move and scale the HUD along with the camera frame since the last call"""
+        center, width = self.frame.get_center(), self.frame.width
+        old_center, old_width = self.frame_state
+        if width != old_width or not np.array_equal(center, old_center):
+            self.shift(-old_center).scale(width / old_width, about_point=ORIGIN).shift(center)
+            self.frame_state = (center, width)
+            # The bar was rescaled, so its fill has to be redrawn
+            self.shown.pop("progress", None)
+
+    def refresh(self, mobject):
+        self.follow_frame()
+        day = self.day.get_value()
+
+        clock = f"{day:7.2f}"
+        if self.shown.get("clock") != clock:
+            self.clock.set_text(clock)
+            self.shown["clock"] = clock
+
+        status = self.milestone(day).replace("_", " ")
+        if self.shown.get("status") != status:
+            self.status.set_text(status)
+            self.shown["status"] = status
+
+        progress = round(float(np.clip(day / self.total_days, 0, 1)), 4)
+        if self.shown.get("progress") != progress:
+            bottom, top = self.bar.get_corner(DL), self.bar.get_corner(UL)
+            right = self.bar_point(progress)[0] - bottom[0]
+            self.bar_fill.set_points_as_corners([
+                bottom, bottom + RIGHT * right, top + RIGHT * right, top, bottom,
+            ])
+            self.shown["progress"] = progress
@@ -0,0 +1,226 @@
+"""
+JWST Render Layers
+Chapters rendered as separately cached layers and composited into the chapter cache
+"""
+
+import hashlib
+import shutil
+from pathlib import Path
+
+import av
+from manim import *
+import numpy as np
+from manim.scene.scene_file_writer import to_av_frame_rate
+
+from src.utils.constants import CHAPTER_CACHE, RENDER_LAYERS
+from src.utils.glow import Glow
+from src.utils.render_cache import (
+    chapter_cache_key, chapter_segment_path, render_settings_hash, update_mobject_digest,
+)
+from src.utils.rng import get_seed
+from src.utils.starfield import StarField
+from src.utils.static_layer import StaticLayer
+
+# Layer of mobjects nobody assigned one to, by type (checked in order)
+TYPE_LAYERS = [
+    ((StaticLayer, StarField), "background"),
+    (Glow, "effects"),
+    ((Text, MarkupText, Paragraph), "hud"),
+]
+
+
+def set_layer(layer, *mobjects):
+    """Put mobjects, with everything in them, on the named layer"""
+    if layer not in RENDER_LAYERS["order"]:
+        raise ValueError(f"Unknown layer {layer!r}, expected one of {', '.join(RENDER_LAYERS['order'])}")
+    for mobject in mobjects:
+        mobject.render_layer = layer
+
+
+def mobject_layers(mobjects):
+    """Layer of every family member of mobjects, by id.
+
+    A mobject's layer is the one set with set_layer, else the one of its
+    type in TYPE_LAYERS, else its parent's (so the glyphs of a Text are on
+    the text's layer), else RENDER_LAYERS["default"]. Pass the scene's
+    top-level mobjects: only those that are nobody's submobject are walked
+    from, parents first, and a mobject keeps the first layer it is given.
+    """
+    children = {id(sub) for mobject in mobjects for sub in mobject.get_family()[1:]}
+    layers = {}
+
+    def visit(mobject, parent_layer):
+        if id(mobject) in layers:
+            return
+        layer = getattr(mobject, "render_layer", None)
+        if layer is None:
+            layer = next((name for types, name in TYPE_LAYERS if isinstance(mobject, types)), parent_layer)
+        layers[id(mobject)] = layer
+        for submobject in mobject.submobjects:
+            visit(submobject, layer)
+
+    for mobject in mobjects:
+        if id(mobject) not in children:
+            visit(mobject, RENDER_LAYERS["default"])
+    return layers
+
+
+class LayerRecorder:
+    """Fingerprint of each layer of each chapter, from a pass with every play skipped.
+
+    After every play the state of each layer's mobjects (glows together with
+    their sources), the camera frame and the animations acting on the layer
+    go into that layer's digest. A change that only touches one layer, say
+    the color of a label, only changes that layer's key.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.chapters = {}
+        self.current = None
+        play = scene.play
+
+        def recorded_play(*args, **kwargs):
+            play(*args, **kwargs)
+            self.record()
+
+        scene.play = recorded_play
+
+    def begin_chapter(self, name, chapter):
+        self.current = {
+            "key": chapter_cache_key(chapter, self.scene),
+            "digests": {layer: hashlib.sha256(layer.encode()) for layer in RENDER_LAYERS["order"]},
+            "used": set(),
+        }
+        self.chapters[name] = self.current
+
+    def record(self):
+        if self.current is None:
+            return
+        scene = self.scene
+        layers = mobject_layers(scene.mobjects)
+        members = {layer: [] for layer in RENDER_LAYERS["order"]}
+        for mobject in scene.get_mobject_family_members():
+            members[layers[id(mobject)]].append(mobject)
+        acting = {layer: [] for layer in RENDER_LAYERS["order"]}
+        for animation in scene.animations or []:
+            for layer in {layers.get(id(m)) for m in animation.mobject.get_family()} & set(acting):
+                acting[layer].append(f"{type(animation).__name__}:{animation.rate_func.__name__}")
+
+        for layer, digest in self.current["digests"].items():
+            digest.update(repr([scene.duration, acting[layer]]).encode())
+            digest.update(np.round(scene.camera.frame.points, 6).tobytes())
+            update_mobject_digest(digest, members[layer])
+            for glow in members[layer]:
+                if isinstance(glow, Glow):
+                    update_mobject_digest(digest, glow.source.get_family())
+            if any(m.get_num_points() for m in members[layer]):
+                self.current["used"].add(layer)
+
+    def layer_keys(self, name):
+        """Cache key of every layer of the chapter that draws anything, in compositing order"""
+        chapter = self.chapters[name]
+        keys = {}
+        for layer in RENDER_LAYERS["order"]:
+            if layer in chapter["used"]:
+                digest = chapter["digests"][layer].copy()
+                digest.update(render_settings_hash().encode())
+                digest.update(str(get_seed()).encode())
+                keys[layer] = digest.hexdigest()[:20]
+        return keys
+
+
+def layer_segment_path(chapter_name, layer, key):
+    """Location of the cached (transparent) video of one layer of a chapter"""
+    directory = Path(config.get_dir("media_dir")) / RENDER_LAYERS["directory"]
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{chapter_name}_{layer}_{key}.mov"
+
+
+def render_layer_segment(scene_class, chapter_name, layer, path):
+    """Render only the mobjects on layer, over transparent black, into path"""
+    layer_config = {
+        "transparent": True,
+        "output_file": f"{scene_class.__name__}_{chapter_name}_{layer}",
+        "partial_movie_dir": "{video_dir}/partial_movie_files/{scene_name}/" + f"{chapter_name}_{layer}",
+    }
+    with tempconfig(layer_config):
+        scene = scene_class(render_chapters=[chapter_name], render_layer=layer, prewarm=False)
+        scene.render()
+    shutil.move(str(scene.renderer.file_writer.movie_file_path), path)
+
+
+def held_frames(path):
+    """Every frame slot of the video at path as a premultiplied RGBA array.
+
+    Held frames (see src/utils/holds.py) are repeated until the next
+    timestamp, so layers with different holds still line up frame by frame.
+    """
+    with av.open(str(path)) as container:
+        previous, index = None, 0
+        for frame in container.decode(video=0):
+            slot = round(frame.time * config.frame_rate)
+            while previous is not None and index < slot:
+                yield previous
+                index += 1
+            previous = frame.to_ndarray(format="rgba")
+        if previous is not None:
+            yield previous
+
+
+def composite_layers(paths, output_path, background_color):
+    """Stack the layer videos in paths (bottom first) onto background_color.
+
+    The result is encoded like Manim's partial movies, so it can be
+    stitched into the film with the other chapter segments.
+    """
+    background = np.array(color_to_int_rgb(background_color), dtype=np.float32)
+    with av.open(str(output_path), mode="w") as container:
+        stream = container.add_stream("libx264", rate=to_av_frame_rate(config.frame_rate), options={"crf": "23"})
+        stream.pix_fmt = "yuv420p"
+        stream.width = config.pixel_width
+        stream.height = config.pixel_height
+
+        for frames in zip(*[held_frames(path) for path in paths]):
+            canvas = np.broadcast_to(background, (config.pixel_height, config.pixel_width, 3))
+            for frame in frames:
+                # Cairo leaves premultiplied color behind
+                alpha = frame[..., 3:] / 255
+                canvas = frame[..., :3] + canvas * (1 - alpha)
+            av_frame = av.VideoFrame.from_ndarray(np.round(canvas).astype(np.uint8), format="rgb24")
+            for packet in stream.encode(av_frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+
+
+def render_layered(scene_class):
+    """Fill the chapter cache by rendering and compositing layers.
+
+    One skipped pass fingerprints every layer of every chapter. Chapters
+    already in the chapter cache are left alone; for the others only the
+    layers whose key changed are rendered again before all layers are
+    composited into the chapter's segment. A normal render of scene_class
+    afterwards stitches the film from the chapter cache.
+    """
+    with tempconfig({"write_to_movie": False}):
+        scene = scene_class(layer_pass=True)
+        scene.render()
+    recorder = scene.layer_recorder
+
+    for name in recorder.chapters:
+        segment = chapter_segment_path(CHAPTER_CACHE["directory"], name, recorder.chapters[name]["key"])
+        if segment.exists():
+            continue
+        paths = []
+        for layer, key in recorder.layer_keys(name).items():
+            path = layer_segment_path(name, layer, key)
+            if path.exists():
+                logger.info("Chapter %s: layer %s unchanged", name, layer)
+            else:
+                logger.info("Chapter %s: rendering layer %s", name, layer)
+                render_layer_segment(scene_class, name, layer, path)
+            paths.append(path)
+        if paths:
+            composite_layers(paths, segment, scene.camera.background_color)
+            logger.info("Chapter %s: layers composited into %s", name, segment)
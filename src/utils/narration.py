@@ -0,0 +1,162 @@
+"""
+JWST Narration
+Build the voice-over from jwst_script.txt in cached, parallel sentence chunks
+"""
+
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydub import AudioSegment
+
+from src.utils.constants import NARRATION
+
+# "[chapter_name]" on its own line starts a chapter's narration
+CHAPTER_MARKER = re.compile(r"^\[(\w+)\]$")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class GTTSBackend:
+    """Google Text-to-Speech (needs network); voice is the gTTS tld accent"""
+    name = "gtts"
+    extension = ".mp3"
+    # Network bound, so chunks are requested concurrently
+    max_workers = 8
+
+    def __init__(self, lang, voice=None):
+        from gtts import gTTS
+        self.gTTS = gTTS
+        self.lang = lang
+        self.voice = voice or "com"
+
+    def synthesize(self, text, path):
+        self.gTTS(text, lang=self.lang, tld=self.voice).save(str(path))
+
+
+class Pyttsx3Backend:
+    """Offline speech with the system engine (SAPI5, NSSpeechSynthesizer, eSpeak)"""
+    name = "pyttsx3"
+    extension = ".wav"
+    # The engine is not thread safe
+    max_workers = 1
+
+    def __init__(self, lang, voice=None):
+        import pyttsx3
+        self.engine = pyttsx3.init()
+        self.lang = lang
+        self.voice = voice
+        if voice:
+            self.engine.setProperty("voice", voice)
+
+    def synthesize(self, text, path):
+        self.engine.save_to_file(text, str(path))
+        self.engine.runAndWait()
+
+
+class SilentBackend:
+    """Stand-in that writes silence as long as the text would take to read"""
+    name = "stub"
+    extension = ".wav"
+    max_workers = 8
+    words_per_second = 2.5
+
+    def __init__(self, lang, voice=None):
+        self.lang = lang
+        self.voice = voice
+
+    def synthesize(self, text, path):
+        seconds = len(text.split()) / self.words_per_second
+        AudioSegment.silent(duration=int(seconds * 1000)).export(str(path), format="wav")
+
+
+BACKENDS = {backend.name: backend for backend in [GTTSBackend, Pyttsx3Backend, SilentBackend]}
+
+
+def split_script(text):
+    """Chapters of the script as {chapter: [paragraphs]}, each paragraph a list of sentences.
+
+    Text before the first chapter marker (or the whole script, if it has
+    none) belongs to the chapter named "narration".
+    """
+    chapters = {}
+    chapter = "narration"
+    for block in re.split(r"\n\s*\n", text):
+        lines = []
+        for line in block.strip().splitlines():
+            marker = CHAPTER_MARKER.match(line.strip())
+            if marker:
+                chapter = marker.group(1)
+            elif line.strip():
+                lines.append(line.strip())
+        # Headings keep their own line; sentences are split at end punctuation
+        sentences = [s for line in lines for s in SENTENCE_END.split(line) if s]
+        if sentences:
+            chapters.setdefault(chapter, []).append(sentences)
+    return chapters
+
+
+def chunk_path(backend, text, cache_dir):
+    """Cache file of one synthesized chunk: content hash, backend, language and voice"""
+    key = hashlib.sha256(repr([backend.name, backend.lang, backend.voice, text]).encode()).hexdigest()[:20]
+    return Path(cache_dir) / f"{key}{backend.extension}"
+
+
+def synthesize_chunks(backend, sentences, cache_dir, max_workers=None):
+    """Synthesize every sentence not cached yet, in parallel; return {sentence: path}"""
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    paths = {sentence: chunk_path(backend, sentence, cache_dir) for sentence in sentences}
+    missing = [sentence for sentence, path in paths.items() if not path.exists()]
+
+    def synthesize(sentence):
+        path = paths[sentence]
+        # Write under a temporary name, so an interrupted run never leaves a bad chunk
+        temp_path = path.with_name(f"{path.stem}_temp{path.suffix}")
+        backend.synthesize(sentence, temp_path)
+        temp_path.replace(path)
+
+    workers = min(max_workers or backend.max_workers, backend.max_workers)
+    print(f"{len(sentences) - len(missing)} chunks cached, synthesizing {len(missing)}")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(synthesize, missing))
+    return paths
+
+
+def stitch(paragraphs, paths, sentence_pause=NARRATION["sentence_pause_ms"],
+           paragraph_pause=NARRATION["paragraph_pause_ms"]):
+    """One AudioSegment of the paragraphs, with short pauses between chunks"""
+    audio = AudioSegment.empty()
+    for i, sentences in enumerate(paragraphs):
+        if i:
+            audio += AudioSegment.silent(duration=paragraph_pause)
+        for j, sentence in enumerate(sentences):
+            if j:
+                audio += AudioSegment.silent(duration=sentence_pause)
+            audio += AudioSegment.from_file(paths[sentence])
+    return audio
+
+
+def build_narration(script=NARRATION["script"], output=NARRATION["output"], backend=NARRATION["backend"],
+                    lang=NARRATION["lang"], voice=NARRATION["voice"], cache_dir=NARRATION["cache_dir"],
+                    max_workers=None):
+    """Build the full voice-over, plus one file per chapter if the script has chapter markers"""
+    backend = BACKENDS[backend](lang, voice)
+    chapters = split_script(Path(script).read_text(encoding="utf-8"))
+    sentences = list(dict.fromkeys(s for paragraphs in chapters.values() for p in paragraphs for s in p))
+    paths = synthesize_chunks(backend, sentences, cache_dir, max_workers)
+
+    output = Path(output)
+    export_format = output.suffix.lstrip(".")
+    full = AudioSegment.empty()
+    for chapter, paragraphs in chapters.items():
+        audio = stitch(paragraphs, paths)
+        if len(chapters) > 1:
+            chapter_output = output.with_name(f"{output.stem}_{chapter}{output.suffix}")
+            audio.export(str(chapter_output), format=export_format)
+            print(f"{chapter}: {len(audio) / 1000:.1f} s -> {chapter_output}")
+            if len(full):
+                full += AudioSegment.silent(duration=NARRATION["paragraph_pause_ms"])
+        full += audio
+    full.export(str(output), format=export_format)
+    print(f"Narration: {len(full) / 1000:.1f} s -> {output}")
+    return output
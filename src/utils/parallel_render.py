@@ -0,0 +1,64 @@
+"""
+JWST Parallel Rendering
+Render the chapters of a scene in a process pool, filling the chapter cache
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from manim import config, logger, tempconfig
+
+from src.utils.rng import get_seed, set_seed
+
+# Config entries a worker needs to render exactly like the parent process
+WORKER_CONFIG_KEYS = [
+    "pixel_width",
+    "pixel_height",
+    "frame_rate",
+    "media_dir",
+    "input_file",
+    "format",
+    "transparent",
+    "write_to_movie",
+    "verbosity",
+]
+
+
+def render_chapter_segment(scene_class, chapter_name, settings, seed, scene_kwargs):
+    """Worker: render one chapter of scene_class into the chapter cache.
+
+    Earlier chapters are played with animations skipped, which hands the
+    camera frame and the (seeded) background over at the chapter boundary
+    exactly as a sequential render would.
+    """
+    worker_config = dict(settings)
+    worker_config["output_file"] = f"{scene_class.__name__}_{chapter_name}"
+    worker_config["progress_bar"] = "none"
+    # Own partial movie directory, so workers never share a concat file list
+    worker_config["partial_movie_dir"] = "{video_dir}/partial_movie_files/{scene_name}/" + chapter_name
+
+    set_seed(seed)
+    with tempconfig(worker_config):
+        scene_class(render_chapters=[chapter_name], prewarm=False, **scene_kwargs).render()
+    return chapter_name
+
+
+def render_chapters_parallel(scene_class, chapter_names, workers, **scene_kwargs):
+    """Render every chapter segment in its own process.
+
+    Afterwards a normal render of scene_class finds all chapters in the
+    chapter cache and only stitches the segments together in order.
+    """
+    settings = {key: config[key] for key in WORKER_CONFIG_KEYS}
+    workers = max(1, min(workers, len(chapter_names)))
+    logger.info("Rendering %d chapters in %d processes", len(chapter_names), workers)
+
+    # spawn, not fork: the parent may already hold Cairo/PyAV state and threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(render_chapter_segment, scene_class, name, settings, get_seed(), scene_kwargs)
+            for name in chapter_names
+        ]
+        for future in as_completed(futures):
+            logger.info("Chapter %s rendered", future.result())
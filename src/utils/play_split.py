@@ -0,0 +1,245 @@
+"""
+JWST Play Splitting
+Render the frames of one long play() in several processes and stitch the ranges back together
+"""
+
+import multiprocessing
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+from manim import CairoRenderer, config, logger, tempconfig
+
+from src.utils.constants import CHAPTER_CACHE, PLAY_SPLIT
+from src.utils.parallel_render import WORKER_CONFIG_KEYS
+from src.utils.render_cache import chapter_segment_path
+from src.utils.rng import get_seed, set_seed
+
+# Frame window of a play that is stepped through from start to end and drawn nowhere
+STEP = (0, 0)
+
+
+class FrameRangeRenderer(CairoRenderer):
+    """CairoRenderer that draws only a window of a play's frames and steps through the rest.
+
+    A stepped frame runs the same interpolation and updaters as a drawn one
+    and moves the scene time on by one frame; it just isn't rasterized or
+    encoded. So state that builds up frame by frame (TracedPath points, dt
+    updaters, per-frame random draws, anything reading scene.time) is where
+    a full render would have left it when the window starts. A play whose
+    window is STEP writes no partial movie at all.
+
+    While a single render layer is drawn (see src/utils/layers.py) it also
+    hands the camera the scene's top-level mobjects, which the layers are
+    worked out from. In a dry run it draws nothing at all: Manim's own
+    update_frame ignores skipping and would rasterize once per play.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (first, last) frames of the next play to draw; None draws them all
+        self.frame_window = None
+        self.play_start = 0.0
+        self.play_frame = 0
+
+    def play(self, scene, *args, **kwargs):
+        self.play_start, self.play_frame = self.time, 0
+        if self.frame_window != STEP:
+            super().play(scene, *args, **kwargs)
+            return
+        # Skipped as far as the file writer is concerned; MasterScene still
+        # hands play_internal every frame time (get_time_progression)
+        original, self._original_skipping_status = self._original_skipping_status, True
+        try:
+            super().play(scene, *args, **kwargs)
+        finally:
+            self._original_skipping_status = original
+        # A drawn play ends with this update too
+        scene.update_mobjects(0)
+
+    def update_frame(self, scene, *args, **kwargs):
+        if getattr(scene, "dry_run", False):
+            return
+        if getattr(self.camera, "render_layer", None) is None:
+            super().update_frame(scene, *args, **kwargs)
+            return
+        # Layers are inherited from the scene's top-level mobjects (only set
+        # while drawing, so it never ends up in a play's hash)
+        self.camera.layer_roots = [*scene.mobjects, *scene.foreground_mobjects]
+        try:
+            super().update_frame(scene, *args, **kwargs)
+        finally:
+            self.camera.layer_roots = None
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if getattr(scene, "dry_run", False):
+            self.static_image = None
+            return None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects):
+        if self.frame_window is None:
+            super().render(scene, time, moving_mobjects)
+            return
+        if self.play_frame == 0:
+            # A skipped play has already moved the time on by its whole run time
+            self.time = self.play_start
+        first, last = self.frame_window
+        if first <= self.play_frame < last:
+            super().render(scene, time, moving_mobjects)
+        else:
+            self.time += 1 / self.camera.frame_rate
+        self.play_frame += 1
+
+
+def play_frame_count(duration):
+    """Frames a play of duration seconds is drawn in (as Manim's time progression)"""
+    return len(np.arange(0, duration, 1 / config.frame_rate))
+
+
+def split_frames(frames, ranges):
+    """(first, last) windows cutting frames into ranges nearly equal parts"""
+    bounds = np.linspace(0, frames, ranges + 1).round().astype(int)
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+def _play_directory():
+    directory = Path(config.get_dir("media_dir")) / PLAY_SPLIT["directory"]
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def play_range_path(chapter, key, play, window, frames):
+    """Location of frames first to last (of frames) of play number play in a chapter"""
+    first, last = window
+    return _play_directory() / f"{chapter}_{key}_play{play}_{first}-{last}of{frames}{config.movie_file_extension}"
+
+
+def joined_play_path(chapter, key, play):
+    """Location of the ranges of play number play in a chapter, stitched together"""
+    return _play_directory() / f"{chapter}_{key}_play{play}{config.movie_file_extension}"
+
+
+def play_ranges(chapter, key, play):
+    """Range files covering every frame of the play, in order, or None if any is missing"""
+    pattern = re.compile(rf"{re.escape(chapter)}_{key}_play{play}_(\d+)-(\d+)of(\d+)$")
+    found = {}
+    for path in _play_directory().glob(f"{chapter}_{key}_play{play}_*{config.movie_file_extension}"):
+        match = pattern.match(path.stem)
+        if match:
+            first, last, frames = map(int, match.groups())
+            found[first] = (last, frames, path)
+
+    paths, frame = [], 0
+    while frame in found:
+        last, frames, path = found[frame]
+        paths.append(path)
+        if last == frames:
+            return paths
+        frame = last
+    return None
+
+
+def joined_play(file_writer, chapter, key, play):
+    """The play's stitched ranges if every range has been rendered, else None"""
+    joined = joined_play_path(chapter, key, play)
+    if joined.exists():
+        return joined
+    ranges = play_ranges(chapter, key, play)
+    if ranges is None:
+        return None
+    temporary = joined.with_name(f"{joined.stem}_temp{joined.suffix}")
+    file_writer.combine_files([str(path) for path in ranges], temporary)
+    temporary.replace(joined)
+    return joined
+
+
+def render_play_range(scene_class, chapter, play, window, frames, settings, seed):
+    """Worker: render one frame window of one play into the play range directory.
+
+    The chapter starts like a chapter worker's (from its snapshot, or after
+    the earlier chapters played skipped), so it gets the same cache key.
+    Every play before this one in the chapter, and every frame before the
+    window, is stepped through without drawing.
+    """
+    first, last = window
+    tag = f"{chapter}_play{play}_{first}-{last}"
+    worker_config = dict(settings)
+    worker_config["output_file"] = f"{scene_class.__name__}_{tag}"
+    worker_config["progress_bar"] = "none"
+    worker_config["partial_movie_dir"] = "{video_dir}/partial_movie_files/{scene_name}/" + tag
+
+    set_seed(seed)
+    with tempconfig(worker_config):
+        scene = scene_class(
+            render_chapters=[chapter], play_range=(chapter, play, first, last, frames), prewarm=False,
+        )
+        scene.render()
+        path = play_range_path(chapter, scene.chapter_key, play, window, frames)
+        if not path.exists():
+            shutil.move(str(scene.renderer.file_writer.movie_file_path), path)
+    return tag
+
+
+def plan_play_splits(records, chapter_keys, chapter_names, workers):
+    """(chapter, play, frames, windows) of every play worth splitting into ranges.
+
+    records are the per-play records of a dry run. Waits are left whole
+    (one that holds still is a single frozen frame anyway), and so are
+    chapters already in the chapter cache.
+    """
+    plans, counts = [], {}
+    for record in records:
+        chapter = record["chapter"]
+        play = counts[chapter] = counts.get(chapter, -1) + 1
+        if chapter not in chapter_names or record["animations"] == "Wait":
+            continue
+        if record["duration_s"] < PLAY_SPLIT["min_seconds"]:
+            continue
+        if chapter_segment_path(CHAPTER_CACHE["directory"], chapter, chapter_keys[chapter]).exists():
+            continue
+        frames = play_frame_count(record["duration_s"])
+        ranges = min(workers, frames // PLAY_SPLIT["min_range_frames"])
+        if ranges > 1:
+            plans.append((chapter, play, frames, split_frames(frames, ranges)))
+    return plans
+
+
+def render_plays_split(scene_class, chapter_names, workers):
+    """Render the long plays of chapter_names in frame ranges, one process per range.
+
+    A dry run finds the plays, and the chapter keys their ranges are filed
+    under. A chapter render afterwards (sequential or one of
+    render_chapters_parallel's workers) steps through each of these plays
+    without drawing it and stitches its ranges in instead.
+    """
+    with tempconfig({"write_to_movie": False}):
+        scene = scene_class(dry_run=True)
+        scene.render()
+    settings = {key: config[key] for key in WORKER_CONFIG_KEYS}
+
+    jobs = []
+    for chapter, play, frames, windows in plan_play_splits(
+        scene.profiler.records, scene.chapter_keys, chapter_names, workers
+    ):
+        key = scene.chapter_keys[chapter]
+        if joined_play_path(chapter, key, play).exists():
+            continue
+        for window in windows:
+            if not play_range_path(chapter, key, play, window, frames).exists():
+                jobs.append((chapter, play, window, frames))
+    if not jobs:
+        return
+    logger.info("Rendering %d play ranges in %d processes", len(jobs), workers)
+
+    # spawn, not fork: the parent may already hold Cairo/PyAV state and threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(jobs))), mp_context=context) as executor:
+        futures = [
+            executor.submit(render_play_range, scene_class, chapter, play, window, frames, settings, get_seed())
+            for chapter, play, window, frames in jobs
+        ]
+        for future in as_completed(futures):
+            logger.info("Play range %s rendered", future.result())
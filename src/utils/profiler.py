@@ -0,0 +1,194 @@
+"""
+JWST Render Profiler
+Opt-in per-play() timings for MasterScene, written as JSON/CSV with a top-N summary
+"""
+
+import csv
+import inspect
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import manim
+from manim import config, logger
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is not reported
+    resource = None
+
+MANIM_DIR = Path(manim.__file__).resolve().parent
+PROFILER_FILE = Path(__file__).resolve()
+
+# Timed phases: (object, method name, phase). Rasterization is timed by
+# DeploymentCamera itself: wrappers stored on the camera would end up in
+# Manim's play hashes and defeat its partial movie cache.
+TIMED_METHODS = [
+    ("scene", "update_to_time", "interpolate"),
+    ("file_writer", "write_frame", "encode_wait"),
+    ("file_writer", "end_animation", "encode_wait"),
+    # Run on the file writer's thread, overlapping the phases above (the
+    # second is HoldFileWriter's, when holds are on)
+    ("file_writer", "encode_and_write_frame", "encode"),
+    ("file_writer", "encode_frame_at", "encode"),
+]
+PHASES = ["interpolate", "raster", "encode", "encode_wait"]
+REPORT_FIELDS = [
+    "index", "chapter", "line", "animations", "start_s", "duration_s", "family_mobjects",
+    "frames", "skipped", "wall_s", *[f"{phase}_s" for phase in PHASES], "peak_rss_mb",
+]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def caller_line(*skip_files):
+    """file:line of the scene code that called play() or wait(), looking past skip_files"""
+    frame = inspect.currentframe()
+    while frame is not None:
+        path = Path(frame.f_code.co_filename).resolve()
+        # Scene overrides of play()/wait() (MasterScene.wait) are not the caller either
+        if (
+            path != PROFILER_FILE and path not in skip_files and MANIM_DIR not in path.parents
+            and frame.f_code.co_name not in ("play", "wait")
+        ):
+            try:
+                path = path.relative_to(Path.cwd())
+            except ValueError:
+                pass
+            return f"{path}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?"
+
+
+# Profiler of the scene being rendered in this process, if any
+_active_profiler = None
+
+
+@contextmanager
+def timed_phase(phase):
+    """Add the time spent in the block to phase of the play being profiled"""
+    record = _active_profiler.current if _active_profiler is not None else None
+    if record is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record[f"{phase}_s"] += time.perf_counter() - start
+
+
+class PlayProfiler:
+    """Records one entry per play()/wait() of a scene.
+
+    Wraps the scene's play and the renderer hot spots (interpolation and
+    frame encoding) on the instances only, so nothing is timed unless a
+    profiler is attached.
+    """
+
+    def __init__(self, scene):
+        global _active_profiler
+        _active_profiler = self
+        self.scene = scene
+        self.records = []
+        self.current = None
+        self._wrap(scene, "play", self._profile_play)
+
+        targets = {
+            "scene": scene,
+            "file_writer": scene.renderer.file_writer,
+        }
+        for target, method, phase in TIMED_METHODS:
+            if hasattr(targets[target], method):
+                self._wrap(targets[target], method, self._timed(phase))
+        self._wrap(scene.renderer.file_writer, "write_frame", self._counted)
+
+    def _wrap(self, obj, name, wrapper):
+        setattr(obj, name, wrapper(getattr(obj, name)))
+
+    def _timed(self, phase):
+        def wrapper(method):
+            def timed(*args, **kwargs):
+                with timed_phase(phase):
+                    return method(*args, **kwargs)
+            return timed
+        return wrapper
+
+    def _counted(self, write_frame):
+        def counted(frame, num_frames=1):
+            if self.current is not None:
+                self.current["frames"] += num_frames
+            return write_frame(frame, num_frames=num_frames)
+        return counted
+
+    def _profile_play(self, play):
+        def profiled_play(*args, **kwargs):
+            scene = self.scene
+            record = {
+                "index": len(self.records),
+                "chapter": getattr(scene, "chapter_name", None),
+                "line": caller_line(),
+                "start_s": scene.time,
+                "family_mobjects": len(scene.get_mobject_family_members()),
+                "frames": 0,
+                **{f"{phase}_s": 0.0 for phase in PHASES},
+            }
+            self.current = record
+            start = time.perf_counter()
+            try:
+                return play(*args, **kwargs)
+            finally:
+                self.current = None
+                record["wall_s"] = time.perf_counter() - start
+                record["duration_s"] = scene.time - record["start_s"]
+                record["animations"] = " ".join(type(a).__name__ for a in scene.animations or [])
+                record["skipped"] = scene.renderer.skip_animations
+                record["peak_rss_mb"] = peak_rss_mb()
+                self.records.append(record)
+        return profiled_play
+
+    def top(self, count):
+        """The count most expensive plays, slowest first"""
+        return sorted(self.records, key=lambda r: r["wall_s"], reverse=True)[:count]
+
+    def summary(self, count):
+        lines = [f"{'wall s':>8} {'interp':>7} {'raster':>7} {'encode':>7} {'frames':>6}  {'chapter':<28} line / animations"]
+        for r in self.top(count):
+            lines.append(
+                f"{r['wall_s']:8.2f} {r['interpolate_s']:7.2f} {r['raster_s']:7.2f} {r['encode_s']:7.2f} "
+                f"{r['frames']:6d}  {str(r['chapter']):<28} {r['line']}  {r['animations']}"
+            )
+        total = sum(r["wall_s"] for r in self.records)
+        lines.append(f"{len(self.records)} plays, {total:.2f} s in play()/wait(), peak RSS {peak_rss_mb()} MB")
+        return "\n".join(lines)
+
+    def write_report(self, directory, top=15):
+        """Write <output>.json and <output>.csv plus the top-N summary, return the JSON path"""
+        directory = Path(config.get_dir("media_dir")) / directory
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = Path(self.scene.renderer.file_writer.output_name).name
+
+        records = [
+            {field: round(r[field], 4) if isinstance(r[field], float) else r[field] for field in REPORT_FIELDS}
+            for r in self.records
+        ]
+        report = directory / f"{stem}.json"
+        report.write_text(json.dumps({"plays": records, "top": [r["index"] for r in self.top(top)]}, indent=1))
+        with open(directory / f"{stem}.csv", "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+
+        summary = self.summary(top)
+        (directory / f"{stem}_top.txt").write_text(summary + "\n")
+        logger.info("Render profile written to %s\n%s", report, summary)
+        return report
@@ -0,0 +1,71 @@
+"""
+JWST Rate Functions
+Rate functions sampled once into lookup tables, for scalar and array alphas alike
+"""
+
+import array
+
+import numpy as np
+
+from src.utils.constants import RATE_FUNCTIONS, RATE_LOOKUP
+
+# Lookup tables already built in this process, by (rate function, samples)
+_lookups = {}
+
+
+class LookupRateFunction:
+    """A rate function read from a dense table of its values on [0, 1].
+
+    Called with a number it is a couple of float operations (no NumPy
+    scalar math, which is what makes smooth or the spring slow when Manim
+    evaluates them per submobject per frame); called with an array it
+    evaluates every alpha in one vectorized step. Both interpolate linearly
+    between samples, so they agree exactly. Alphas outside [0, 1] go to the
+    original function. Hashing a play only sees the original function's
+    source (the table is an array.array, which Manim's hasher skips).
+    """
+
+    def __init__(self, rate_func, samples=RATE_LOOKUP["samples"]):
+        self.rate_func = rate_func
+        self.__name__ = getattr(rate_func, "__name__", type(rate_func).__name__)
+        self.intervals = samples
+        table = np.array([rate_func(t) for t in np.linspace(0, 1, samples + 1)], dtype=float)
+        self.values = array.array("d", table)
+        self.table = table
+
+    def __call__(self, t):
+        if isinstance(t, np.ndarray):
+            return self.evaluate(t)
+        if not 0 <= t <= 1:
+            return self.rate_func(t)
+        position = t * self.intervals
+        index = min(int(position), self.intervals - 1)
+        low = self.values[index]
+        return low + (self.values[index + 1] - low) * (position - index)
+
+    def evaluate(self, alphas):
+        """The rate function at every alpha of an array"""
+        alphas = np.asarray(alphas, dtype=float)
+        position = np.clip(alphas, 0, 1) * self.intervals
+        index = np.minimum(position.astype(int), self.intervals - 1)
+        low = self.table[index]
+        result = low + (self.table[index + 1] - low) * (position - index)
+        outside = (alphas < 0) | (alphas > 1)
+        if outside.any():
+            result[outside] = [self.rate_func(t) for t in alphas[outside]]
+        return result
+
+
+def lookup_rate_func(rate_func, samples=RATE_LOOKUP["samples"]):
+    """rate_func as a LookupRateFunction, built once per function"""
+    if isinstance(rate_func, LookupRateFunction):
+        return rate_func
+    key = (rate_func, samples)
+    if key not in _lookups:
+        _lookups[key] = LookupRateFunction(rate_func, samples)
+    return _lookups[key]
+
+
+def rate_function(name):
+    """The lookup table of RATE_FUNCTIONS[name] ("smooth_deployment", "spring", ...)"""
+    return lookup_rate_func(RATE_FUNCTIONS[name])
@@ -0,0 +1,161 @@
+"""
+JWST Render Cache
+Chapter-level segment cache keyed by chapter source, constants and scene state
+"""
+
+import functools
+import hashlib
+import inspect
+import types
+from pathlib import Path
+
+import numpy as np
+from manim import __version__ as MANIM_VERSION
+from manim import config
+
+from src.utils.rng import get_seed
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Mobject attributes that decide what a mobject looks like on screen
+STATE_ARRAY_ATTRS = [
+    "points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas",
+    "rgbas", "radii", "depths",
+]
+STATE_SCALAR_ATTRS = [
+    "stroke_width", "background_stroke_width", "z_index", "intensity", "glow_width", "spread",
+    "layer_opacity", "layer_key",
+]
+
+
+def _is_project_object(obj):
+    """True if obj is a function or class defined inside this repository"""
+    try:
+        source_file = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    if source_file is None:
+        return False
+    return PROJECT_ROOT in Path(source_file).resolve().parents
+
+
+def _describe_value(value):
+    """Stable text description of a constant (no memory addresses)"""
+    if isinstance(value, dict):
+        items = ", ".join(f"{k!r}: {_describe_value(v)}" for k, v in value.items())
+        return "{" + items + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_describe_value(v) for v in value) + "]"
+    if isinstance(value, np.ndarray):
+        return repr(np.round(value, 6).tolist())
+    if callable(value):
+        return getattr(value, "__qualname__", type(value).__name__)
+    return repr(value)
+
+
+def _iter_code_names(code):
+    """All global and attribute names used by a code object and its nested functions"""
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_code_names(const)
+
+
+def chapter_fingerprint(chapter, scene):
+    """Hash a chapter's source together with everything it reads.
+
+    Follows project functions, scene helper methods (``scene.create_jwst_model``)
+    and module-level constants referenced from the chapter, so editing any of
+    them invalidates the chapter.
+    """
+    digest = hashlib.sha256()
+    pending = [chapter]
+    seen = set()
+
+    while pending:
+        func = pending.pop()
+        if isinstance(func, functools.partial):
+            digest.update(_describe_value([func.args, func.keywords]).encode())
+            func = func.func
+        func = inspect.unwrap(func)
+        if id(func) in seen or not _is_project_object(func):
+            continue
+        seen.add(id(func))
+
+        digest.update(inspect.getsource(func).encode())
+        if not hasattr(func, "__code__"):
+            continue
+
+        for name in sorted(set(_iter_code_names(func.__code__))):
+            if name in func.__globals__:
+                value = func.__globals__[name]
+                if inspect.isfunction(value) or inspect.isclass(value):
+                    pending.append(value)
+                elif not inspect.ismodule(value) and not name.startswith("_"):
+                    # Private module globals are runtime caches, not settings
+                    digest.update(f"{name}={_describe_value(value)}".encode())
+            method = getattr(type(scene), name, None)
+            if inspect.isfunction(method):
+                pending.append(method)
+
+    return digest.hexdigest()
+
+
+def scene_state_hash(scene):
+    """Hash the camera frame and every mobject currently in the scene.
+
+    Scene time is deliberately left out: skipped plays advance it by whole
+    run times while rendered plays advance it frame by frame, so including
+    it would make every chapter after a cached one miss.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(scene.camera.background_color).encode())
+    frame = getattr(scene.camera, "frame", None)
+    if frame is not None:
+        digest.update(np.round(frame.points, 6).tobytes())
+
+    update_mobject_digest(digest, scene.get_mobject_family_members())
+    return digest.hexdigest()
+
+
+def update_mobject_digest(digest, mobjects):
+    """Feed what each of mobjects looks like on screen into digest"""
+    for mobject in mobjects:
+        digest.update(type(mobject).__name__.encode())
+        for attr in STATE_ARRAY_ATTRS:
+            value = getattr(mobject, attr, None)
+            if isinstance(value, np.ndarray):
+                digest.update(np.round(value, 6).tobytes())
+        for attr in STATE_SCALAR_ATTRS:
+            digest.update(repr(getattr(mobject, attr, None)).encode())
+
+
+def render_settings_hash():
+    """Hash the output settings a segment was encoded with"""
+    settings = [
+        MANIM_VERSION,
+        config.pixel_width,
+        config.pixel_height,
+        config.frame_rate,
+        config.movie_file_extension,
+        config.transparent,
+    ]
+    return hashlib.sha256(repr(settings).encode()).hexdigest()
+
+
+def chapter_cache_key(chapter, scene):
+    """Cache key for a chapter about to be played in the given scene"""
+    digest = hashlib.sha256()
+    digest.update(chapter_fingerprint(chapter, scene).encode())
+    digest.update(scene_state_hash(scene).encode())
+    digest.update(render_settings_hash().encode())
+    # Geometry a chapter creates itself comes from the seeded random streams
+    digest.update(str(get_seed()).encode())
+    return digest.hexdigest()[:20]
+
+
+def chapter_segment_path(directory, name, key):
+    """Location of the cached video segment for a chapter"""
+    directory = Path(config.get_dir("media_dir")) / directory
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{name}_{key}{config.movie_file_extension}"
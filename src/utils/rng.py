@@ -0,0 +1,33 @@
+"""
+JWST Random Streams
+Seeded random number generators, one independent stream per chapter and purpose
+"""
+
+import zlib
+
+import numpy as np
+
+from src.utils.constants import RANDOM_SEED
+
+_seed = RANDOM_SEED
+
+
+def set_seed(seed):
+    """Change the project seed (render.py --seed) before the scene is built"""
+    global _seed
+    _seed = int(seed)
+
+
+def get_seed():
+    return _seed
+
+
+def random_stream(*names):
+    """A fresh generator for the stream called names, e.g. ("intro", "parallax").
+
+    The stream only depends on the project seed and its names, not on how
+    many numbers other chapters drew before it, so each chapter's geometry
+    stays the same when other chapters change, are skipped or are cached.
+    """
+    keys = [zlib.crc32(name.encode()) for name in names]
+    return np.random.default_rng(np.random.SeedSequence([_seed, *keys]))
@@ -0,0 +1,120 @@
+"""
+JWST Frame Scrubbing
+Render single frames at chosen film times while every play is skipped
+"""
+
+from pathlib import Path
+
+from manim import config, logger
+from manim.utils.exceptions import EndSceneEarlyException
+from tqdm import tqdm
+
+from src.utils.constants import SCRUB
+
+
+def parse_time(spec):
+    """"95.2" -> (None, 95.2); "primary_mirror+4.5" -> ("primary_mirror", 4.5)"""
+    chapter, plus, offset = spec.rpartition("+")
+    if not plus:
+        return None, float(spec)
+    return chapter, float(offset)
+
+
+def window_times(offset, window):
+    """Frame times covering window seconds centered on offset"""
+    if window <= 0:
+        return [offset]
+    step = 1 / config.frame_rate
+    count = int(round(window / step))
+    return [max(0.0, offset + (i - count / 2) * step) for i in range(count + 1)]
+
+
+class FrameScrubber:
+    """Saves the frames at the requested times of a scene that skips every play.
+
+    Skipped plays run each animation straight to its end; the scrubber splits
+    the play that contains a requested time so the scene is interpolated to
+    exactly that moment, rasterizes it and saves a PNG. Times can be absolute
+    or relative to the start of a chapter (resolved when its section starts).
+    Once the last frame is saved the rest of the film is not constructed.
+    """
+
+    def __init__(self, scene, specs, window=0.0, directory=SCRUB["directory"]):
+        self.scene = scene
+        self.relative = {}
+        self.pending = []
+        for chapter, offset in map(parse_time, specs):
+            times = window_times(offset, window)
+            if chapter is None:
+                self.pending += times
+            else:
+                self.relative.setdefault(chapter, []).extend(times)
+        self.pending.sort()
+        self.capture_at = {}
+        self.saved = []
+        self.directory = Path(config.get_dir("media_dir")) / directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        renderer = scene.renderer
+        scene.next_section = self._chapter_start(scene.next_section)
+        scene.get_time_progression = self._split_progression(scene.get_time_progression)
+        scene.update_to_time = self._capture_after(scene.update_to_time)
+        renderer.freeze_current_frame = self._capture_frozen(renderer.freeze_current_frame)
+
+    def _chapter_start(self, next_section):
+        def chapter_start(name="unnamed", *args, **kwargs):
+            for offset in self.relative.pop(name, []):
+                self.pending.append(self.scene.time + offset)
+            self.pending.sort()
+            return next_section(name, *args, **kwargs)
+        return chapter_start
+
+    def _due(self, start, duration):
+        """Requested times that fall inside [start, start + duration)"""
+        due = [t for t in self.pending if t < start + duration]
+        self.pending = self.pending[len(due):]
+        return due
+
+    def _split_progression(self, get_time_progression):
+        def split_progression(run_time, *args, **kwargs):
+            # A skipped play has already added its run time to the scene time
+            start = self.scene.time - run_time
+            due = self._due(start, run_time)
+            if not due:
+                return get_time_progression(run_time, *args, **kwargs)
+            self.capture_at = {max(t - start, 0.0): t for t in due}
+            return tqdm(sorted(self.capture_at) + [run_time], disable=True)
+        return split_progression
+
+    def _capture_after(self, update_to_time):
+        def capture_after(t):
+            update_to_time(t)
+            if t in self.capture_at:
+                renderer = self.scene.renderer
+                renderer.update_frame(self.scene, self.scene.moving_mobjects)
+                self.save(self.capture_at.pop(t), renderer.camera.get_image())
+        return capture_after
+
+    def _capture_frozen(self, freeze_current_frame):
+        def capture_frozen(duration):
+            # The frozen frame was drawn just before; every time inside it looks the same
+            renderer = self.scene.renderer
+            for t in self._due(self.scene.time - duration, duration):
+                self.save(t, renderer.camera.get_image())
+            return freeze_current_frame(duration)
+        return capture_frozen
+
+    def save(self, film_time, image):
+        chapter = getattr(self.scene, "chapter_name", None)
+        path = self.directory / f"{chapter}_{film_time:09.3f}s.png"
+        image.save(path)
+        self.saved.append(path)
+        logger.info("Frame at %.3f s (%s) saved to %s", film_time, chapter, path)
+        if not self.pending and not self.capture_at and not self.relative:
+            raise EndSceneEarlyException()
+
+    def report(self):
+        unresolved = self.pending + [t for times in self.relative.values() for t in times]
+        if unresolved:
+            logger.warning("%d requested frames are past the end of the film or in unknown chapters", len(unresolved))
+        return self.saved
@@ -0,0 +1,87 @@
+"""
+JWST Chapter Snapshots
+Scene state saved at chapter boundaries, so a chapter range can start without replaying earlier chapters
+"""
+
+import hashlib
+import os
+import pickle
+import random
+from pathlib import Path
+
+import numpy as np
+from manim import config, logger
+
+from src.utils.constants import SNAPSHOTS
+from src.utils.render_cache import chapter_fingerprint, render_settings_hash
+from src.utils.rng import get_seed
+
+
+def snapshot_key(scene, earlier_chapters):
+    """Key of the state the scene is in after construct's setup and earlier_chapters.
+
+    Built from the code that produced the state (not from the state itself,
+    which a range render does not have yet): construct and every earlier
+    chapter, with everything they read, plus the seed and Manim version.
+    """
+    digest = hashlib.sha256()
+    for func in [type(scene).construct, *earlier_chapters]:
+        digest.update(chapter_fingerprint(func, scene).encode())
+    digest.update(render_settings_hash().encode())
+    digest.update(str(get_seed()).encode())
+    return digest.hexdigest()[:20]
+
+
+def snapshot_path(name, key):
+    """Location of the snapshot taken as chapter name starts"""
+    return Path(config.get_dir("media_dir")) / SNAPSHOTS["directory"] / f"{name}_{key}.pkl"
+
+
+def save_snapshot(scene, path):
+    """Pickle the scene's mobjects, camera frame, time and random state to path.
+
+    Returns False (and writes nothing) if something on screen cannot be
+    pickled, typically an updater defined inside a chapter function, or if
+    the file cannot be written: a missing snapshot only means replaying.
+    """
+    state = {
+        "mobjects": scene.mobjects,
+        "frame": scene.camera.frame,
+        "background": scene.background,
+        "updaters": scene.updaters,
+        "time": scene.renderer.time,
+        "random": random.getstate(),
+        "np_random": np.random.get_state(),
+    }
+    try:
+        data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        logger.info("No snapshot at %s: %s", path.stem, error)
+        return False
+
+    # Written aside and moved into place: parallel workers replaying the
+    # same chapters save the same snapshot at once
+    temporary = path.with_name(f"{path.stem}_{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+    except OSError as error:
+        logger.info("No snapshot at %s: %s", path.stem, error)
+        temporary.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def load_snapshot(scene, path):
+    """Put the scene back into the state saved in path"""
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    scene.clear()
+    scene.add(*state["mobjects"])
+    scene.camera.frame.become(state["frame"])
+    scene.background = state["background"]
+    scene.updaters = state["updaters"]
+    scene.renderer.time = state["time"]
+    random.setstate(state["random"])
+    np.random.set_state(state["np_random"])
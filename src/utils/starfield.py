@@ -0,0 +1,61 @@
+"""
+JWST Star Field
+A whole star field as one mobject, with per-star data held in NumPy arrays
+"""
+
+from manim import *
+import numpy as np
+
+
+class StarField(PMobject):
+    """Stars stored as arrays instead of one Dot per star.
+
+    Positions live in ``points``, brightness in the alpha channel of
+    ``rgbas``, and radii and parallax depth factors in ``radii`` and
+    ``depths``. DeploymentCamera draws the whole field in one vectorized pass.
+    """
+
+    def __init__(self, positions, radii, brightness, depths=None, color=WHITE, **kwargs):
+        super().__init__(color=color, **kwargs)
+        positions = np.array(positions, dtype=float)
+        count = len(positions)
+
+        self.points = positions
+        self.rgbas = np.repeat([color_to_rgba(color)], count, axis=0)
+        self.rgbas[:, 3] = brightness
+        self.radii = np.broadcast_to(np.asarray(radii, dtype=float), (count,)).copy()
+        if depths is None:
+            depths = np.ones(count)
+        self.depths = np.broadcast_to(np.asarray(depths, dtype=float), (count,)).copy()
+
+    def reset_points(self):
+        super().reset_points()
+        self.radii = np.zeros(0)
+        self.depths = np.zeros(0)
+        return self
+
+    def get_array_attrs(self):
+        return super().get_array_attrs() + ["radii", "depths"]
+
+    def scale(self, scale_factor, **kwargs):
+        super().scale(scale_factor, **kwargs)
+        self.radii = self.radii * abs(scale_factor)
+        return self
+
+    def shift_by_depth(self, vector):
+        """Shift every star by vector times its depth factor (parallax)"""
+        self.points = self.points + np.outer(self.depths, vector)
+        return self
+
+    def set_opacity(self, opacity, family=True):
+        self.rgbas[:, 3] = opacity
+        return self
+
+    def fade(self, darkness=0.5, family=True):
+        self.rgbas[:, 3] *= 1 - darkness
+        return self
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        super().interpolate_color(mobject1, mobject2, alpha)
+        self.radii = interpolate(mobject1.radii, mobject2.radii, alpha)
+        return self
@@ -0,0 +1,125 @@
+"""
+JWST Static Layer
+Mobjects that never change, rasterized once and blitted into every frame
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from manim import *
+import numpy as np
+from PIL import Image
+
+from src.utils.constants import ASSET_CACHE, STATIC_LAYER
+from src.utils.render_cache import update_mobject_digest
+
+# Premultiplied RGBA rasters already loaded in this process, by layer key
+_layer_images = {}
+# Last scaled tile per layer key: a camera that holds still reuses it as is
+_last_tiles = {}
+
+
+def _layer_resolution(width, height):
+    """Raster size for a layer of width x height units, oversampled and capped at max_size"""
+    pixels_per_unit = config.pixel_width / config.frame_width * STATIC_LAYER["oversample"]
+    pixels_per_unit = min(pixels_per_unit, STATIC_LAYER["max_size"] / max(width, height))
+    return max(1, round(width * pixels_per_unit)), max(1, round(height * pixels_per_unit))
+
+
+def _layer_cache_file(key):
+    return Path(config.get_dir("media_dir")) / ASSET_CACHE["directory"] / f"layer_{key}.npz"
+
+
+def _pixels_to_image(pixels):
+    return Image.frombytes("RGBa", (pixels.shape[1], pixels.shape[0]), pixels.tobytes())
+
+
+def rasterize_layer(mobjects, corners, resolution):
+    """Draw mobjects over a transparent background covering corners (UL, DR).
+
+    Returns the premultiplied RGBA pixel array Cairo leaves behind.
+    """
+    # camera.py imports this module to draw StaticLayers
+    from src.utils.camera import DeploymentCamera
+
+    upper_left, lower_right = corners
+    camera = DeploymentCamera(
+        pixel_width=resolution[0],
+        pixel_height=resolution[1],
+        frame_width=lower_right[0] - upper_left[0],
+        frame_height=upper_left[1] - lower_right[1],
+        frame_center=(upper_left + lower_right) / 2,
+        background_opacity=0,
+    )
+    camera.capture_mobjects(mobjects)
+    return np.array(camera.pixel_array)
+
+
+class StaticLayer(Mobject):
+    """A group of mobjects drawn as one cached image.
+
+    The mobjects are rasterized once at STATIC_LAYER["oversample"] times
+    the output resolution, enough for the closest camera zoom the chapters
+    use, and cached on disk keyed by their geometry and colors. After that
+    DeploymentCamera blits the image into each frame with the camera
+    transform applied. The layer itself only holds the two corners of the
+    image (so it can be moved and scaled like any mobject) and an opacity,
+    which is what ``FadeIn``/``FadeOut`` and ``set_opacity`` change.
+    """
+
+    def __init__(self, *mobjects, **kwargs):
+        super().__init__(**kwargs)
+        group = Group(*mobjects)
+        margin = STATIC_LAYER["margin"]
+        self.points = np.array([
+            group.get_corner(UL) + margin * UL,
+            group.get_corner(DR) + margin * DR,
+        ])
+        self.layer_opacity = 1.0
+
+        width, height = (self.points[1] - self.points[0])[:2] * [1, -1]
+        resolution = _layer_resolution(width, height)
+        digest = hashlib.sha256(repr(resolution).encode())
+        update_mobject_digest(digest, group.get_family())
+        self.layer_key = digest.hexdigest()[:20]
+
+        cache_file = _layer_cache_file(self.layer_key)
+        if self.layer_key not in _layer_images and not cache_file.exists():
+            pixels = rasterize_layer(mobjects, self.points, resolution)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Written aside and moved into place: parallel workers build the
+            # same layer at once and must never load a half-written file
+            temporary = cache_file.with_name(f"{cache_file.stem}_{os.getpid()}.tmp")
+            with open(temporary, "wb") as f:
+                np.savez_compressed(f, pixels=pixels)
+            os.replace(temporary, cache_file)
+            _layer_images[self.layer_key] = _pixels_to_image(pixels)
+
+    def get_image(self):
+        """The cached raster as a premultiplied (RGBa) PIL image"""
+        if self.layer_key not in _layer_images:
+            # Also the way in for layers unpickled from a chapter snapshot
+            with np.load(_layer_cache_file(self.layer_key)) as data:
+                _layer_images[self.layer_key] = _pixels_to_image(data["pixels"])
+        return _layer_images[self.layer_key]
+
+    def set_opacity(self, opacity, family=True):
+        self.layer_opacity = opacity
+        return self
+
+    def fade(self, darkness=0.5, family=True):
+        return self.set_opacity(self.layer_opacity * (1 - darkness))
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        self.layer_opacity = interpolate(mobject1.layer_opacity, mobject2.layer_opacity, alpha)
+        return self
+
+    def get_tile(self, size, box):
+        """The part of the raster inside box (image pixels), scaled to size"""
+        request = (size, tuple(np.round(box, 3)))
+        last = _last_tiles.get(self.layer_key)
+        if last is None or last[0] != request:
+            tile = np.asarray(self.get_image().resize(size, Image.Resampling.BILINEAR, box=box))
+            last = _last_tiles[self.layer_key] = (request, tile)
+        return last[1]
@@ -0,0 +1,131 @@
+"""
+JWST Text Cache
+Memoized Text factory with a process-pool prewarm of every title a render needs
+"""
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import *
+
+from src.utils.constants import ASSET_CACHE
+
+# Built Text mobjects by (text, style) key; cached_text hands out copies
+_text_cache = {}
+# Every (text, style) requested during this run, saved to the manifest
+_requested = {}
+
+
+def _plain_value(value):
+    """JSON-friendly form of a Text keyword value (colors become hex strings)"""
+    if isinstance(value, ManimColor):
+        return value.to_hex()
+    return value
+
+
+def _text_key(text, kwargs):
+    return json.dumps([text, {k: _plain_value(v) for k, v in sorted(kwargs.items())}])
+
+
+def _manifest_path():
+    return Path(config.get_dir("media_dir")) / ASSET_CACHE["directory"] / ASSET_CACHE["text_manifest"]
+
+
+def cached_text(text, **kwargs):
+    """Text(text, **kwargs), built once per run and copied afterwards"""
+    try:
+        key = _text_key(text, kwargs)
+    except TypeError:
+        # Keywords that have no stable description are simply not cached
+        return Text(text, **kwargs)
+
+    _requested[key] = True
+    if key not in _text_cache:
+        _text_cache[key] = Text(text, **kwargs)
+    return _text_cache[key].copy()
+
+
+def _build_text(key, media_dir):
+    """Worker: lay out one Text (writing its Pango SVG to the text dir) and return it"""
+    config.media_dir = media_dir
+    text, kwargs = json.loads(key)
+    return Text(text, **kwargs)
+
+
+def _manifest_parts():
+    manifest = _manifest_path()
+    return sorted(manifest.parent.glob(f"{manifest.stem}_*.part"))
+
+
+def read_text_manifest():
+    """Keys in the manifest plus those saved (per process) since it was last merged, and those part files"""
+    manifest = _manifest_path()
+    keys = json.loads(manifest.read_text()) if manifest.exists() else []
+    seen = set(keys)
+    parts = _manifest_parts()
+    for part in parts:
+        for key in json.loads(part.read_text()):
+            if key not in seen:
+                keys.append(key)
+                seen.add(key)
+    return keys, parts
+
+
+def merge_text_manifest():
+    """Fold the part files processes saved into the manifest, return its keys.
+
+    Only the top-level render process calls this, so the manifest itself
+    has a single writer.
+    """
+    keys, parts = read_text_manifest()
+    if parts:
+        manifest = _manifest_path()
+        temp_manifest = manifest.with_name(f"{manifest.stem}_{os.getpid()}.tmp")
+        temp_manifest.write_text(json.dumps(keys, indent=1))
+        temp_manifest.replace(manifest)
+        for part in parts:
+            part.unlink(missing_ok=True)
+    return keys
+
+
+def prewarm_texts(workers=None):
+    """Build every Text listed in the manifest of earlier runs in a process pool.
+
+    Pango layout and SVG parsing are CPU bound, so the strings are laid out
+    in parallel and the finished mobjects are sent back to fill the memo.
+    If a mobject can't be sent back, its SVG is still left in the text dir,
+    which is what makes building it again in this process cheap (and what
+    render workers, which never prewarm themselves, profit from).
+    """
+    keys = [key for key in merge_text_manifest() if key not in _text_cache]
+    if not keys:
+        return
+
+    workers = workers or ASSET_CACHE["text_workers"] or os.cpu_count()
+    media_dir = config.get_dir("media_dir")
+    logger.info("Prewarming %d texts in %d processes", len(keys), workers)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(keys)), mp_context=context) as executor:
+        futures = {key: executor.submit(_build_text, key, media_dir) for key in keys}
+        for key, future in futures.items():
+            try:
+                _text_cache[key] = future.result()
+            except Exception as error:
+                logger.debug("Text %s not prewarmed: %s", key, error)
+
+
+def save_text_manifest():
+    """Save the texts requested in this process for prewarm_texts.
+
+    Every process writes a part file of its own (parallel workers finish
+    at the same time); the next prewarm merges them into the manifest.
+    """
+    manifest = _manifest_path()
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    part = manifest.with_name(f"{manifest.stem}_{os.getpid()}.part")
+    temp_part = part.with_suffix(".tmp")
+    temp_part.write_text(json.dumps(list(_requested), indent=1))
+    temp_part.replace(part)
@@ -0,0 +1,87 @@
+"""
+JWST Timeline
+Per-play timeline of a dry run, checked against the SCENE_DURATIONS budgets
+"""
+
+import csv
+import json
+from pathlib import Path
+
+from manim import config, logger
+
+from src.utils.constants import SCENE_DURATIONS, TIMELINE
+
+TIMELINE_FIELDS = ["index", "start_s", "duration_s", "chapter", "transition", "line", "animations"]
+
+
+def is_transition(chapter):
+    return chapter.endswith("_transition")
+
+
+def timeline_entries(records):
+    """One row per play()/wait() in film order, times in seconds"""
+    return [
+        {
+            "index": r["index"],
+            "start_s": round(r["start_s"], 4),
+            "duration_s": round(r["duration_s"], 4),
+            "chapter": r["chapter"],
+            "transition": is_transition(r["chapter"] or ""),
+            "line": r["line"],
+            "animations": r["animations"],
+        }
+        for r in records
+    ]
+
+
+def chapter_durations(entries):
+    """Start and length of every chapter, in film order"""
+    chapters = {}
+    for entry in entries:
+        chapter = chapters.setdefault(entry["chapter"], {"start_s": entry["start_s"], "duration_s": 0.0})
+        chapter["duration_s"] = round(entry["start_s"] + entry["duration_s"] - chapter["start_s"], 4)
+    return chapters
+
+
+def check_budgets(chapters, budgets=SCENE_DURATIONS, tolerance=TIMELINE["tolerance"]):
+    """Chapters whose length misses their budget by more than tolerance (relative)"""
+    misses = []
+    for name, budget in budgets.items():
+        if name not in chapters:
+            continue
+        duration = chapters[name]["duration_s"]
+        if abs(duration - budget) > tolerance * budget:
+            misses.append({"chapter": name, "duration_s": duration, "budget_s": budget})
+    return misses
+
+
+def write_timeline(records, directory=TIMELINE["directory"], name="timeline"):
+    """Write the timeline as JSON and CSV, log the chapter table and return the budget misses"""
+    entries = timeline_entries(records)
+    chapters = chapter_durations(entries)
+    misses = check_budgets(chapters)
+
+    directory = Path(config.get_dir("media_dir")) / directory
+    directory.mkdir(parents=True, exist_ok=True)
+    report = directory / f"{name}.json"
+    report.write_text(json.dumps({"plays": entries, "chapters": chapters, "budget_misses": misses}, indent=1))
+    with open(directory / f"{name}.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TIMELINE_FIELDS)
+        writer.writeheader()
+        writer.writerows(entries)
+
+    lines = [f"{'start':>8} {'length':>8} {'budget':>7}  chapter"]
+    for chapter, times in chapters.items():
+        budget = SCENE_DURATIONS.get(chapter)
+        lines.append(
+            f"{times['start_s']:8.2f} {times['duration_s']:8.2f} {budget if budget else '':>7}  {chapter}"
+        )
+    end = entries[-1]["start_s"] + entries[-1]["duration_s"] if entries else 0
+    lines.append(f"{len(entries)} plays, {end:.2f} s in total")
+    logger.info("Timeline written to %s\n%s", report, "\n".join(lines))
+
+    for miss in misses:
+        logger.warning(
+            "Chapter %s runs %.2f s, budget is %s s", miss["chapter"], miss["duration_s"], miss["budget_s"]
+        )
+    return misses